@@ -1,6 +1,6 @@
 from .base import BaseDescriptor, Property, Display
 from .ports import InputPort, OutputPort
-from .properties import Range, Integer, Bool, Enum
+from .properties import Range, Integer, Float, Bool, Enum
 from .actions import Action
 from .store import Store
 from .node import (
@@ -8,6 +8,7 @@ from .node import (
     get_node_branches,
     get_all_node_classes, 
     build_node_palette,
+    snapshot_node_branches,
     discover_nodes,
     rediscover_nodes,
     clear_node_registry,
@@ -22,6 +23,7 @@ __all__ = [
     "OutputPort",
     "Range",
     "Integer",
+    "Float",
     "Bool",
     "Enum",
     "Store",
@@ -29,6 +31,7 @@ __all__ = [
     "get_node_branches",
     "get_all_node_classes",
     "build_node_palette",
+    "snapshot_node_branches",
     "discover_nodes",
     "rediscover_nodes",
     "clear_node_registry",
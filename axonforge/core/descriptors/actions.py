@@ -1,9 +1,17 @@
+import sys
 from typing import Any, List, Optional
 from .base import BaseDescriptor
 
 
+def _noop(params=None):
+    """Fallback for actions whose callback method is missing."""
+    return None
+
+
 class Action(BaseDescriptor):
     """Action descriptor for triggering callbacks (e.g., button clicks)."""
+
+    __slots__ = ("callback", "params", "confirm")
     
     def __init__(self, label: str, callback: str, params: Optional[List[dict]] = None, confirm: bool = False):
         super().__init__(label)
@@ -11,15 +19,24 @@ class Action(BaseDescriptor):
         self.params = params or []
         self.confirm = confirm
 
+    def __set_name__(self, owner, name: str):
+        super().__set_name__(owner, name)
+        # Per-instance cache slot for the resolved callback
+        self._attr = sys.intern(f"_{name}_callback")
+
     def __get__(self, obj, objtype=None):
         if obj is None:
             return self
-        callback = getattr(obj, self.callback, None)
-        if callable(callback):
-            return callback
-        return lambda params=None: None
+        attrs = obj.__dict__
+        callback = attrs.get(self._attr)
+        if callback is None:
+            callback = getattr(obj, self.callback, None)
+            if not callable(callback):
+                callback = _noop
+            attrs[self._attr] = callback
+        return callback
 
-    def to_spec(self, value: Any = None) -> dict:
+    def _make_spec_template(self) -> dict:
         return {
             "type": "action",
             "label": self.label,
@@ -27,3 +44,6 @@ class Action(BaseDescriptor):
             "params": self.params,
             "confirm": self.confirm,
         }
+
+    def to_spec(self, value: Any = None) -> dict:
+        return self._spec_base()
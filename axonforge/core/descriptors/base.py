@@ -1,3 +1,4 @@
+import sys
 from typing import Any, Callable, Optional, Union, TypeVar, Generic, overload
 
 T = TypeVar("T")
@@ -6,20 +7,45 @@ T = TypeVar("T")
 class BaseDescriptor:
     """Base class for all node metadata descriptors."""
 
+    __slots__ = ("label", "name", "_attr", "_spec_template")
+
     def __init__(self, label: str):
-        self.label = label
+        # Labels and names repeat across every spec; intern them once
+        self.label = sys.intern(label) if isinstance(label, str) else label
         self.name: Optional[str] = None
+        # Instance attribute holding the value, e.g. "_threshold"
+        self._attr: Optional[str] = None
+        self._spec_template: Optional[dict] = None
 
     def __set_name__(self, owner, name: str):
-        self.name = name
+        self.name = sys.intern(name)
+        self._attr = sys.intern(f"_{name}")
+        self._spec_template = None
 
     def to_spec(self, value: Any = None) -> dict:
         raise NotImplementedError
 
+    def _make_spec_template(self) -> dict:
+        """Return the value-independent part of this descriptor's spec."""
+        raise NotImplementedError
+
+    def _spec_base(self) -> dict:
+        """Return a fresh copy of the cached spec template.
+
+        Subclasses that change spec fields at runtime must reset
+        ``_spec_template`` to ``None`` so it is rebuilt on next use.
+        """
+        template = self._spec_template
+        if template is None:
+            template = self._spec_template = self._make_spec_template()
+        return template.copy()
+
 
 class Property(BaseDescriptor, Generic[T]):
     """Base for interactive property descriptors bound to instance variables."""
 
+    __slots__ = ("default", "on_change", "_on_change_attr", "_on_change_fn")
+
     def __init__(
         self,
         label: str,
@@ -29,6 +55,11 @@ class Property(BaseDescriptor, Generic[T]):
         super().__init__(label)
         self.default = default
         self.on_change = on_change
+        # Resolve the callback kind once instead of on every assignment
+        self._on_change_attr: Optional[str] = on_change if isinstance(on_change, str) else None
+        self._on_change_fn: Optional[Callable] = (
+            on_change if self._on_change_attr is None and callable(on_change) else None
+        )
 
     @overload
     def __get__(self, obj: None, objtype: type) -> "Property[T]": ...
@@ -39,13 +70,14 @@ class Property(BaseDescriptor, Generic[T]):
     def __get__(self, obj, objtype=None):
         if obj is None:
             return self
-        return getattr(obj, f"_{self.name}", self.default)
+        return obj.__dict__.get(self._attr, self.default)
 
     def __set__(self, obj, value: T) -> None:
-        old = getattr(obj, f"_{self.name}", self.default)
+        attrs = obj.__dict__
+        old = attrs.get(self._attr, self.default)
         self.validate(value)
-        setattr(obj, f"_{self.name}", value)
-        if value != old and self.on_change:
+        attrs[self._attr] = value
+        if self.on_change and value != old:
             self._trigger_change(obj, value, old)
 
     def validate(self, value: T) -> None:
@@ -53,18 +85,23 @@ class Property(BaseDescriptor, Generic[T]):
         pass
 
     def _trigger_change(self, obj, new_value: T, old_value: T) -> None:
-        on_change = self.on_change
-        if isinstance(on_change, str):
-            callback = getattr(obj, on_change, None)
+        if self._on_change_attr is not None:
+            callback = getattr(obj, self._on_change_attr, None)
             if callable(callback):
                 callback(new_value, old_value)
-        elif callable(on_change):
-            on_change(obj, new_value, old_value)
+        elif self._on_change_fn is not None:
+            self._on_change_fn(obj, new_value, old_value)
+
+
+# Spec fields the UI needs alongside every streamed display value
+_DISPLAY_CONFIG_KEYS = ("color_mode", "scale_mode", "scale_min", "scale_max")
 
 
 class Display(BaseDescriptor, Generic[T]):
     """Base for display-only output descriptors bound to instance variables."""
 
+    __slots__ = ("default", "on_change", "_config")
+
     def __init__(
         self,
         label: str,
@@ -74,6 +111,24 @@ class Display(BaseDescriptor, Generic[T]):
         super().__init__(label)
         self.default = default
         self.on_change = on_change
+        # (spec template, config) the config was derived from
+        self._config: Optional[tuple] = None
+
+    def display_config(self) -> dict:
+        """Return the display's UI config (color mode / scale settings).
+
+        Derived from the cached spec template and shared between calls, so
+        it follows any runtime change that resets ``_spec_template``; treat
+        it as read-only.
+        """
+        template = self._spec_template
+        if template is None:
+            template = self._spec_template = self._make_spec_template()
+        cached = self._config
+        if cached is None or cached[0] is not template:
+            config = {key: template[key] for key in _DISPLAY_CONFIG_KEYS if key in template}
+            cached = self._config = (template, config)
+        return cached[1]
 
     @overload
     def __get__(self, obj: None, objtype: type) -> "Display[T]": ...
@@ -84,10 +139,10 @@ class Display(BaseDescriptor, Generic[T]):
     def __get__(self, obj, objtype=None):
         if obj is None:
             return self
-        return getattr(obj, f"_{self.name}", self.default)
+        return obj.__dict__.get(self._attr, self.default)
 
     def __set__(self, obj, value: T) -> None:
-        setattr(obj, f"_{self.name}", value)
+        obj.__dict__[self._attr] = value
 
     def _trigger_change(self, obj, new_config: dict, old_config: dict):
         """Trigger on_change callback when display config changes."""
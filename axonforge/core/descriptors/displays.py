@@ -3,38 +3,63 @@ from .base import Display
 
 class Numeric(Display):
     """Scalar output display descriptor."""
+    __slots__ = ("format", "_fmt")
+
     def __init__(self, label: str, format: str = ".4f"):
         super().__init__(label, 0.0)
         self.format = format
+        # Bound str.format with the spec baked in, parsed once
+        self._fmt = ("{:" + format + "}").format
 
-    def to_spec(self, value: Any = None) -> dict:
-        formatted = f"{value:{self.format}}" if isinstance(value, (int, float)) else str(value)
+    def _make_spec_template(self) -> dict:
         return {
             "type": "numeric",
             "label": self.label,
             "format": self.format,
-            "value": value,
-            "formatted": formatted,
         }
 
+    def to_spec(self, value: Any = None) -> dict:
+        spec = self._spec_base()
+        spec["value"] = value
+        spec["formatted"] = self._fmt(value) if isinstance(value, (int, float)) else str(value)
+        return spec
+
+
+class _ArrayDisplay(Display):
+    """Base for array displays."""
+    __slots__ = ()
+
+    @staticmethod
+    def _shape_spec(value: Any) -> Optional[list]:
+        shape = getattr(value, "shape", None)
+        return list(shape) if shape is not None else None
+
 
-class Vector1D(Display):
+class Vector1D(_ArrayDisplay):
     """1D array visualization descriptor."""
+    __slots__ = ("color_mode",)
+
     def __init__(self, label: str, color_mode: str = "grayscale"):
         super().__init__(label)
         self.color_mode = color_mode
 
-    def to_spec(self, value: Any = None) -> dict:
+    def _make_spec_template(self) -> dict:
         return {
             "type": "vector1d",
             "label": self.label,
             "color_mode": self.color_mode,
-            "shape": list(value.shape) if value is not None and hasattr(value, "shape") else None,
         }
 
+    def to_spec(self, value: Any = None) -> dict:
+        spec = self._spec_base()
+        spec["shape"] = self._shape_spec(value)
+        return spec
+
 
-class BarChart(Display):
+class BarChart(_ArrayDisplay):
     """1D array bar chart visualization descriptor."""
+    __slots__ = ("color", "show_negative", "scale_mode", "scale_min", "scale_max")
+
     def __init__(
         self,
         label: str,
@@ -70,6 +95,7 @@ class BarChart(Display):
             self.scale_min = scale_min
         if scale_max is not None:
             self.scale_max = scale_max
+        self._spec_template = None
         # Trigger on_change callback if configured
         if self.on_change and obj is not None:
             self._trigger_change(obj, {
@@ -78,7 +104,7 @@ class BarChart(Display):
                 "scale_max": self.scale_max,
             }, old_config)
 
-    def to_spec(self, value: Any = None) -> dict:
+    def _make_spec_template(self) -> dict:
         return {
             "type": "barchart",
             "label": self.label,
@@ -87,12 +113,18 @@ class BarChart(Display):
             "scale_mode": self.scale_mode,
             "scale_min": self.scale_min,
             "scale_max": self.scale_max,
-            "shape": list(value.shape) if value is not None and hasattr(value, "shape") else None,
         }
 
+    def to_spec(self, value: Any = None) -> dict:
+        spec = self._spec_base()
+        spec["shape"] = self._shape_spec(value)
+        return spec
 
-class LineChart(Display):
+
+class LineChart(_ArrayDisplay):
     """1D array line chart visualization descriptor."""
+    __slots__ = ("color", "line_width", "scale_mode", "scale_min", "scale_max")
+
     def __init__(
         self,
         label: str,
@@ -128,6 +160,7 @@ class LineChart(Display):
             self.scale_min = scale_min
         if scale_max is not None:
             self.scale_max = scale_max
+        self._spec_template = None
         # Trigger on_change callback if configured
         if self.on_change and obj is not None:
             self._trigger_change(obj, {
@@ -136,7 +169,7 @@ class LineChart(Display):
                 "scale_max": self.scale_max,
             }, old_config)
 
-    def to_spec(self, value: Any = None) -> dict:
+    def _make_spec_template(self) -> dict:
         return {
             "type": "linechart",
             "label": self.label,
@@ -145,12 +178,18 @@ class LineChart(Display):
             "scale_mode": self.scale_mode,
             "scale_min": self.scale_min,
             "scale_max": self.scale_max,
-            "shape": list(value.shape) if value is not None and hasattr(value, "shape") else None,
         }
 
+    def to_spec(self, value: Any = None) -> dict:
+        spec = self._spec_base()
+        spec["shape"] = self._shape_spec(value)
+        return spec
 
-class Vector2D(Display):
+
+class Vector2D(_ArrayDisplay):
     """2D array visualization descriptor."""
+    __slots__ = ("color_mode",)
+
     def __init__(self, label: str, color_mode: str = "grayscale", on_change: Union[str, Callable, None] = None):
         super().__init__(label, on_change=on_change)
         self.color_mode = color_mode
@@ -165,28 +204,39 @@ class Vector2D(Display):
         old_mode = self.color_mode
         if new_mode != old_mode:
             self.color_mode = new_mode
+            self._spec_template = None
             # Trigger on_change callback if configured
             if self.on_change and obj is not None:
                 self._trigger_change(obj, {"color_mode": new_mode}, {"color_mode": old_mode})
 
-    def to_spec(self, value: Any = None) -> dict:
+    def _make_spec_template(self) -> dict:
         return {
             "type": "vector2d",
             "label": self.label,
             "color_mode": self.color_mode,
-            "shape": list(value.shape) if value is not None and hasattr(value, "shape") else None,
         }
 
+    def to_spec(self, value: Any = None) -> dict:
+        spec = self._spec_base()
+        spec["shape"] = self._shape_spec(value)
+        return spec
+
 
 class Text(Display):
     """Text output display descriptor."""
+    __slots__ = ()
+
     def __init__(self, label: str, default: str = ""):
         super().__init__(label, default)
 
-    def to_spec(self, value: Any = None) -> dict:
+    def _make_spec_template(self) -> dict:
         return {
             "type": "text",
             "label": self.label,
             "default": self.default,
-            "value": value or self.default,
         }
+
+    def to_spec(self, value: Any = None) -> dict:
+        spec = self._spec_base()
+        spec["value"] = value or self.default
+        return spec
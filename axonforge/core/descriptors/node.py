@@ -15,24 +15,64 @@ Usage:
     @branch("Utilities/Display")
     class MyDisplayNode(Node):
         ...
+
+    # Or, equivalently, as a class keyword:
+    class MyOtherNoiseNode(Node, branch="Input/Noise"):
+        ...
 """
 
-from typing import Dict, List, Type, Optional
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Sequence, Type, Optional
 import importlib
+import importlib.metadata
+import importlib.util
+import logging
+import re
 import sys
 from pathlib import Path
 
+log = logging.getLogger(__name__)
+
 
 # Branch registry: {"Input": [Class1, Class2], "Input/Noise": [...], ...}
-_node_branches: Dict[str, List[Type]] = {}
+# Lists while discovery runs, frozen into tuples once it finishes.
+_node_branches: Dict[str, Sequence[Type]] = {}
 
 # Track discovered modules to avoid re-registering
 _discovered_modules: set = set()
 
+# Read-only view handed out to callers; rebuilt whenever the registry is replaced
+_palette_view: Mapping[str, Sequence[Type]] = MappingProxyType(_node_branches)
+
+# Source mtimes (st_mtime_ns) of successfully imported node modules and the
+# (branch, class) registrations they produced, in order. Kept across
+# rediscovery so unchanged modules are re-registered without re-executing them.
+_module_mtimes: Dict[str, int] = {}
+_module_nodes: Dict[str, List[tuple]] = {}
+
+# Source mtimes of loaded modules whose source had no class statement, so an
+# unchanged helper module is skipped on rediscovery without re-reading it
+_classless_mtimes: Dict[str, int] = {}
+
+# Collects registrations while a node module is being imported
+_recording: Optional[List[tuple]] = None
+
+# A module can only define nodes if its source contains a class statement
+_CLASS_STATEMENT = re.compile(rb"^[ \t]*class[ \t]", re.MULTILINE)
+
+# (branch, class) pairs already in _node_branches, for O(1) duplicate checks
+_registered: set = set()
+
+# Entry point group for node packages installed outside the source tree
+ENTRY_POINT_GROUP = "axonforge.nodes"
 
-def get_node_branches() -> Dict[str, List[Type]]:
-    """Get all registered node branches and their classes."""
-    return _node_branches.copy()
+# Fallback branch for plugin nodes that don't declare one
+PLUGIN_BRANCH = "Plugins"
+
+
+def get_node_branches() -> Mapping[str, Sequence[Type]]:
+    """Get a read-only view of all registered node branches and their classes."""
+    return _palette_view
 
 
 def get_all_node_classes() -> List[Type]:
@@ -43,19 +83,51 @@ def get_all_node_classes() -> List[Type]:
     return all_classes
 
 
-def build_node_palette() -> Dict[str, List[Type]]:
-    """Build the node_palette dict from registered branches."""
-    return _node_branches.copy()
+def build_node_palette() -> Mapping[str, Sequence[Type]]:
+    """Build the node_palette view from registered branches."""
+    return _palette_view
+
+
+def snapshot_node_branches() -> Dict[str, List[Type]]:
+    """Get an independent copy of the registered branches."""
+    return {path: list(classes) for path, classes in _node_branches.items()}
 
 
 def clear_node_registry():
     """Clear all registered nodes (for re-discovery)."""
-    global _node_branches, _discovered_modules
+    global _node_branches, _palette_view, _discovered_modules, _registered
     _node_branches = {}
+    _palette_view = MappingProxyType(_node_branches)
     _discovered_modules = set()
+    _registered = set()
+
+
+def _register_branch(path: str, cls: Type):
+    """Add a class to a branch unless it is already listed there."""
+    key = (path, cls)
+    if key in _registered:
+        return
+    _registered.add(key)
+    if _recording is not None:
+        _recording.append(key)
+    classes = _node_branches.get(path)
+    if classes is None:
+        _node_branches[path] = [cls]
+    elif isinstance(classes, tuple):
+        # Registered after discovery froze the registry (e.g. hot reload)
+        _node_branches[path] = classes + (cls,)
+    else:
+        classes.append(cls)
+
+
+def _freeze_branches():
+    """Convert branch lists to tuples once discovery is complete."""
+    for path, classes in _node_branches.items():
+        if not isinstance(classes, tuple):
+            _node_branches[path] = tuple(classes)
 
 
-def discover_nodes(nodes_dir = None, package: str = "axonforge.nodes") -> Dict[str, List[Type]]:
+def discover_nodes(nodes_dir = None, package: str = "axonforge.nodes") -> Mapping[str, Sequence[Type]]:
     """
     Discover all node classes in the nodes directory.
     
@@ -63,30 +135,61 @@ def discover_nodes(nodes_dir = None, package: str = "axonforge.nodes") -> Dict[s
     any classes decorated with @branch("path"). If a Node subclass doesn't have a
     @branch decorator, it will be registered under a branch inferred from its folder path.
     For example, nodes/Utilities/Matrix/dot_product.py -> "Utilities/Matrix"
+    
+    Only the standard library is used (importlib.util / importlib.metadata);
+    pkg_resources is deliberately avoided because of its import cost.
 
     Args:
-        nodes_dir: Directory to scan (defaults to axonforge/nodes)
+        nodes_dir: Directory to scan (defaults to the directories backing `package`)
         package: Package name for imports
 
     Returns:
         Dictionary of discovered node branches
     """
-    from ..node import Node  # Import here to avoid circular imports
-    
     if nodes_dir is None:
-        # Find the nodes directory relative to this file
-        nodes_path: Path = Path(__file__).parent.parent.parent / "nodes"
+        # Ask the import system where the package lives
+        nodes_paths = _package_dirs(package)
+        if not nodes_paths:
+            print(f"Warning: Nodes package not found: {package}")
     else:
-        nodes_path = Path(nodes_dir) if isinstance(nodes_dir, str) else nodes_dir
+        nodes_paths = [Path(nodes_dir) if isinstance(nodes_dir, str) else nodes_dir]
     
-    if not nodes_path.exists():
-        print(f"Warning: Nodes directory not found: {nodes_path}")
-        return _node_branches.copy()
+    for nodes_path in nodes_paths:
+        if not nodes_path.exists():
+            print(f"Warning: Nodes directory not found: {nodes_path}")
+            continue
+        _discover_folder_nodes(nodes_path, package)
     
-    # Get all Python files recursively in the nodes directory
-    py_files = list(nodes_path.rglob("*.py"))
+    _discover_entry_point_nodes()
+    _freeze_branches()
+    
+    return _palette_view
+
+
+def _package_dirs(package: str) -> List[Path]:
+    """
+    Locate the directories backing a package without importing its modules.
     
-    for py_file in py_files:
+    Uses the package's import spec, so both regular and namespace packages
+    (which may span several directories) are resolved the same way the
+    import statement would resolve them.
+    """
+    try:
+        spec = importlib.util.find_spec(package)
+    except (ImportError, ValueError):
+        return []
+    if spec is None or not spec.submodule_search_locations:
+        return []
+    return [Path(location) for location in spec.submodule_search_locations]
+
+
+def _discover_folder_nodes(nodes_path: Path, package: str):
+    """Import every node module below nodes_path and register its classes."""
+    global _recording
+    
+    # Collect (file, relative path, module name, mtime) for every candidate
+    modules = []
+    for py_file in nodes_path.rglob("*.py"):
         # Skip __init__.py directly in the nodes folder (but not in subdirectories)
         if py_file.name == "__init__.py" and py_file.parent == nodes_path:
             continue
@@ -105,25 +208,155 @@ def discover_nodes(nodes_dir = None, package: str = "axonforge.nodes") -> Dict[s
             continue
         
         try:
-            # Import the module to trigger decorator registration
-            if full_module_name in sys.modules:
-                # Reload if already imported
-                importlib.reload(sys.modules[full_module_name])
-            else:
-                importlib.import_module(full_module_name)
+            mtime = py_file.stat().st_mtime_ns
+        except OSError as e:
+            print(f"Warning: Failed to import {full_module_name}: {e}")
+            continue
+        modules.append((py_file, relative, full_module_name, mtime))
+    
+    # An imported module edited since discovery last saw it may be a helper
+    # its package siblings import from. Re-execute those siblings too, after
+    # it, instead of reusing classes built against the old helper.
+    edited = {
+        name for _, _, name, mtime in modules
+        if name in sys.modules
+        and _module_mtimes.get(name, _classless_mtimes.get(name)) != mtime
+    }
+    edited_packages = {name.rpartition(".")[0] for name in edited}
+    stale = {
+        name for _, _, name, _ in modules
+        if name in sys.modules and name.rpartition(".")[0] in edited_packages
+    }
+    modules.sort(key=lambda entry: entry[2] not in edited)
+    
+    # Class-less modules left unexecuted; their mtimes are recorded once
+    # something has actually imported them
+    classless = {}
+    
+    for py_file, relative, full_module_name, mtime in modules:
+        try:
+            if (full_module_name not in stale
+                and _module_mtimes.get(full_module_name) == mtime
+                and _module_is_current(full_module_name)):
+                # Unchanged since it was last imported: reuse the loaded classes
+                for branch_path, cls in _module_nodes[full_module_name]:
+                    _register_branch(branch_path, cls)
+                _discovered_modules.add(full_module_name)
+                log.debug("Reused unchanged node module: %s", full_module_name)
+                continue
             
-            _discovered_modules.add(full_module_name)
+            # Helper modules and empty package markers define no classes;
+            # don't execute them just to find nothing, unless a loaded copy
+            # is stale and the modules importing it need the new code
+            if full_module_name not in stale:
+                if _classless_mtimes.get(full_module_name) == mtime:
+                    continue
+                if not _CLASS_STATEMENT.search(py_file.read_bytes()):
+                    classless[full_module_name] = mtime
+                    continue
+            _classless_mtimes.pop(full_module_name, None)
             
-            # After importing, check for Node subclasses without @branch decorator
-            # and register them using folder-based inference
-            module = sys.modules.get(full_module_name)
-            if module:
-                _register_nodes_from_module(module, relative, nodes_path)
+            _recording = []
+            try:
+                # Import the module to trigger decorator registration
+                if full_module_name in sys.modules:
+                    # Reload if already imported
+                    importlib.reload(sys.modules[full_module_name])
+                else:
+                    importlib.import_module(full_module_name)
+                
+                _discovered_modules.add(full_module_name)
+                
+                # After importing, check for Node subclasses without @branch decorator
+                # and register them using folder-based inference
+                module = sys.modules.get(full_module_name)
+                if module:
+                    _register_nodes_from_module(module, relative, nodes_path)
+                
+                _module_mtimes[full_module_name] = mtime
+                _module_nodes[full_module_name] = _recording
+                log.debug("Discovered node module: %s", full_module_name)
+            finally:
+                _recording = None
             
         except Exception as e:
             print(f"Warning: Failed to import {full_module_name}: {e}")
     
-    return _node_branches.copy()
+    for name, mtime in classless.items():
+        if name in sys.modules:
+            _module_mtimes.pop(name, None)
+            _module_nodes.pop(name, None)
+            _classless_mtimes[name] = mtime
+
+
+def _discover_entry_point_nodes():
+    """
+    Register node classes published by installed packages.
+    
+    Packages expose nodes through the "axonforge.nodes" entry point group,
+    either pointing at a single class or at a module to scan:
+    
+        [project.entry-points."axonforge.nodes"]
+        my_node = "my_pkg.nodes:MyNode"
+        my_nodes = "my_pkg.nodes"
+    
+    Classes keep their @branch path; undecorated ones land under "Plugins".
+    """
+    from ..node import Node  # Import here to avoid circular imports
+    
+    for ep in importlib.metadata.entry_points(group=ENTRY_POINT_GROUP):
+        if ep.value in _discovered_modules:
+            continue
+        
+        try:
+            target = ep.load()
+        except Exception as e:
+            print(f"Warning: Failed to load node entry point {ep.name}: {e}")
+            continue
+        
+        _discovered_modules.add(ep.value)
+        
+        if isinstance(target, type):
+            candidates = [target]
+        else:
+            candidates = [getattr(target, attr_name) for attr_name in dir(target)]
+        
+        for attr in candidates:
+            if (isinstance(attr, type)
+                and issubclass(attr, Node)
+                and attr is not Node
+                and not attr.__name__.startswith('_')):
+                branch_path = getattr(attr, '_node_branch', PLUGIN_BRANCH)
+                _register_branch(branch_path, attr)
+                attr._node_branch = branch_path
+
+
+def _module_is_current(module_name: str) -> bool:
+    """
+    Check that a module's recorded classes are still the ones it defines.
+    
+    A module reloaded outside discovery (e.g. a node hot reload) keeps its
+    file mtime but holds new class objects, so it has to be rescanned.
+    """
+    module = sys.modules.get(module_name)
+    if module is None:
+        return False
+    return all(
+        getattr(module, cls.__name__, None) is cls
+        for _, cls in _module_nodes.get(module_name, ())
+    )
+
+
+def get_discovered_module_mtime(module_name: str) -> Optional[int]:
+    """
+    Get the source mtime (st_mtime_ns) a node module was discovered from.
+    
+    Returns None if discovery never imported it, or if it has since been
+    reloaded elsewhere and no longer holds the classes discovery recorded.
+    """
+    if module_name in _module_mtimes and _module_is_current(module_name):
+        return _module_mtimes[module_name]
+    return None
 
 
 def _register_nodes_from_module(module, relative_file_path: Path, nodes_path: Path):
@@ -153,12 +386,8 @@ def _register_nodes_from_module(module, relative_file_path: Path, nodes_path: Pa
                 branch_path = _infer_branch_from_path(relative_file_path, nodes_path)
                 
                 # Register under inferred branch
-                if branch_path not in _node_branches:
-                    _node_branches[branch_path] = []
-                
-                if attr not in _node_branches[branch_path]:
-                    _node_branches[branch_path].append(attr)
-                    attr._node_branch = branch_path
+                _register_branch(branch_path, attr)
+                attr._node_branch = branch_path
 
 
 def _infer_branch_from_path(relative_file_path: Path, nodes_path: Path) -> str:
@@ -188,7 +417,7 @@ def _infer_branch_from_path(relative_file_path: Path, nodes_path: Path) -> str:
     return branch_path
 
 
-def rediscover_nodes(nodes_dir: Optional[str] = None, package: str = "axonforge.nodes") -> Dict[str, List[Type]]:
+def rediscover_nodes(nodes_dir: Optional[str] = None, package: str = "axonforge.nodes") -> Mapping[str, Sequence[Type]]:
     """
     Re-discover all nodes by clearing registry and re-scanning.
     
@@ -230,13 +459,8 @@ def branch(path: str):
         A decorator function that registers the class under the branch
     """
     def decorator(cls: Type) -> Type:
-        # Register in branch
-        if path not in _node_branches:
-            _node_branches[path] = []
-        
-        # Check if already registered (avoid duplicates on reload)
-        if cls not in _node_branches[path]:
-            _node_branches[path].append(cls)
+        # Register in branch (duplicates on reload are ignored)
+        _register_branch(path, cls)
         
         # Mark with branch metadata
         cls._node_branch = path
@@ -70,11 +70,16 @@ class InputPort(BaseDescriptor, Generic[T]):
             # Accepts numpy array OR list OR tuple
             input_sequence = InputPort("Sequence", [np.ndarray, list, tuple])
     """
+
+    __slots__ = ("data_type", "default", "_formatted_type", "_data_types")
     
     def __init__(self, label: str, data_type: Any = None, default: Optional[T] = None):
         super().__init__(label)
         self.data_type = data_type
         self.default = default
+        # data_type is fixed per class, so format it once for to_spec()
+        self._formatted_type = _format_data_type(data_type)
+        self._data_types = _get_data_types_list(data_type)
     
     @overload
     def __get__(self, obj: None, objtype: type) -> "InputPort[T]": ...
@@ -85,21 +90,23 @@ class InputPort(BaseDescriptor, Generic[T]):
     def __get__(self, obj, objtype=None):
         if obj is None:
             return self
-        return getattr(obj, f"_{self.name}", self.default)
+        return obj.__dict__.get(self._attr, self.default)
     
     def __set__(self, obj, value: T) -> None:
-        setattr(obj, f"_{self.name}", value)
+        obj.__dict__[self._attr] = value
     
-    def to_spec(self) -> dict:
-        spec = {
+    def _make_spec_template(self) -> dict:
+        return {
             "name": self.name,
             "label": self.label,
-            "data_type": _format_data_type(self.data_type),
+            "data_type": self._formatted_type,
         }
+    
+    def to_spec(self) -> dict:
+        spec = self._spec_base()
         # Include list of types for UI tooltip display
-        data_types = _get_data_types_list(self.data_type)
-        if data_types:
-            spec["data_types"] = data_types
+        if self._data_types:
+            spec["data_types"] = list(self._data_types)
         return spec
 
 
@@ -123,11 +130,16 @@ class OutputPort(BaseDescriptor, Generic[T]):
             # Outputs either array or list
             output_flexible = OutputPort("Flexible", [np.ndarray, list])
     """
+
+    __slots__ = ("data_type", "default", "_formatted_type", "_data_types")
     
     def __init__(self, label: str, data_type: Any = None, default: Optional[T] = None):
         super().__init__(label)
         self.data_type = data_type
         self.default = default
+        # data_type is fixed per class, so format it once for to_spec()
+        self._formatted_type = _format_data_type(data_type)
+        self._data_types = _get_data_types_list(data_type)
     
     @overload
     def __get__(self, obj: None, objtype: type) -> "OutputPort[T]": ...
@@ -138,19 +150,21 @@ class OutputPort(BaseDescriptor, Generic[T]):
     def __get__(self, obj, objtype=None):
         if obj is None:
             return self
-        return getattr(obj, f"_{self.name}", self.default)
+        return obj.__dict__.get(self._attr, self.default)
     
     def __set__(self, obj, value: T) -> None:
-        setattr(obj, f"_{self.name}", value)
+        obj.__dict__[self._attr] = value
     
-    def to_spec(self) -> dict:
-        spec = {
+    def _make_spec_template(self) -> dict:
+        return {
             "name": self.name,
             "label": self.label,
-            "data_type": _format_data_type(self.data_type),
+            "data_type": self._formatted_type,
         }
+    
+    def to_spec(self) -> dict:
+        spec = self._spec_base()
         # Include list of types for UI tooltip display
-        data_types = _get_data_types_list(self.data_type)
-        if data_types:
-            spec["data_types"] = data_types
+        if self._data_types:
+            spec["data_types"] = list(self._data_types)
         return spec
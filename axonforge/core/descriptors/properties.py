@@ -5,6 +5,8 @@ from .base import Property
 class Range(Property[float]):
     """Numeric range property descriptor with min/max bounds."""
 
+    __slots__ = ("min_val", "max_val", "step", "scale")
+
     def __init__(
         self,
         label: str,
@@ -27,22 +29,28 @@ class Range(Property[float]):
                 f"{self.name} must be in [{self.min_val}, {self.max_val}], got {value}"
             )
 
-    def to_spec(self, value: Any = None) -> dict:
+    def _make_spec_template(self) -> dict:
         return {
             "type": "range",
             "label": self.label,
             "default": self.default,
-            "value": value if value is not None else self.default,
             "min": self.min_val,
             "max": self.max_val,
             "step": self.step,
             "scale": self.scale,
         }
 
+    def to_spec(self, value: Any = None) -> dict:
+        spec = self._spec_base()
+        spec["value"] = value if value is not None else self.default
+        return spec
+
 
 class Integer(Property[int]):
     """Integer property descriptor."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         label: str,
@@ -57,18 +65,24 @@ class Integer(Property[int]):
         except (TypeError, ValueError):
             raise ValueError(f"{self.name} must be an integer, got {value}")
 
-    def to_spec(self, value: Any = None) -> dict:
+    def _make_spec_template(self) -> dict:
         return {
             "type": "integer",
             "label": self.label,
             "default": self.default,
-            "value": value if value is not None else self.default,
         }
 
+    def to_spec(self, value: Any = None) -> dict:
+        spec = self._spec_base()
+        spec["value"] = value if value is not None else self.default
+        return spec
+
 
 class Float(Property[float]):
     """Float property descriptor."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         label: str,
@@ -83,18 +97,24 @@ class Float(Property[float]):
         except (TypeError, ValueError):
             raise ValueError(f"{self.name} must be a float, got {value}")
 
-    def to_spec(self, value: Any = None) -> dict:
+    def _make_spec_template(self) -> dict:
         return {
             "type": "float",
             "label": self.label,
             "default": self.default,
-            "value": value if value is not None else self.default,
         }
 
+    def to_spec(self, value: Any = None) -> dict:
+        spec = self._spec_base()
+        spec["value"] = value if value is not None else self.default
+        return spec
+
 
 class Bool(Property[bool]):
     """Boolean property descriptor."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         label: str,
@@ -103,18 +123,24 @@ class Bool(Property[bool]):
     ):
         super().__init__(label, default, on_change)
 
-    def to_spec(self, value: Any = None) -> dict:
+    def _make_spec_template(self) -> dict:
         return {
             "type": "bool",
             "label": self.label,
             "default": self.default,
-            "value": value if value is not None else self.default,
         }
 
+    def to_spec(self, value: Any = None) -> dict:
+        spec = self._spec_base()
+        spec["value"] = value if value is not None else self.default
+        return spec
+
 
 class Enum(Property[str]):
     """Enum selection property descriptor."""
 
+    __slots__ = ("options",)
+
     def __init__(
         self,
         label: str,
@@ -129,11 +155,15 @@ class Enum(Property[str]):
         if value not in self.options:
             raise ValueError(f"{self.name} must be one of {self.options}, got {value}")
 
-    def to_spec(self, value: Any = None) -> dict:
+    def _make_spec_template(self) -> dict:
         return {
             "type": "enum",
             "label": self.label,
             "options": self.options,
             "default": self.default,
-            "value": value if value is not None else self.default,
         }
+
+    def to_spec(self, value: Any = None) -> dict:
+        spec = self._spec_base()
+        spec["value"] = value if value is not None else self.default
+        return spec
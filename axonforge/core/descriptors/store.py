@@ -20,6 +20,8 @@ class Store(BaseDescriptor, Generic[T]):
                 # Access directly
                 self.angle += 0.1
     """
+
+    __slots__ = ("default",)
     
     def __init__(self, label: Optional[str] = None, default: Optional[T] = None):
         super().__init__(label or "")
@@ -34,15 +36,18 @@ class Store(BaseDescriptor, Generic[T]):
     def __get__(self, obj, objtype=None):
         if obj is None:
             return self
-        return getattr(obj, f"_{self.name}", self.default)
+        return obj.__dict__.get(self._attr, self.default)
     
     def __set__(self, obj, value: T) -> None:
-        setattr(obj, f"_{self.name}", value)
+        obj.__dict__[self._attr] = value
     
-    def to_spec(self, value: Any = None) -> dict:
-        """Return a specification dict for this store."""
+    def _make_spec_template(self) -> dict:
         return {
             "name": self.name,
             "label": self.label or self.name,
             "default": self.default,
         }
+    
+    def to_spec(self, value: Any = None) -> dict:
+        """Return a specification dict for this store."""
+        return self._spec_base()
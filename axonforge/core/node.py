@@ -1,4 +1,5 @@
 from typing import Any, Callable, Dict, Optional, TypeVar
+import base64
 import json
 import pickle
 import numpy as np
@@ -7,6 +8,7 @@ from .descriptors.base import Property, Display
 from .descriptors.ports import InputPort, OutputPort
 from .descriptors.actions import Action
 from .descriptors.store import Store
+from .descriptors.node import _register_branch
 from .registry import get_connections_for_node
 
 F = TypeVar("F", bound=Callable[..., Any])
@@ -29,7 +31,7 @@ def background_init(func: F) -> F:
 class NodeMeta(type):
     """Metaclass that collects inputs/outputs/properties/actions from class attributes."""
     
-    def __new__(mcs, name, bases, namespace):
+    def __new__(mcs, name, bases, namespace, **kwargs):
         # Start with inherited registries so subclasses can extend/override.
         _input_ports = {}
         _output_ports = {}
@@ -65,7 +67,7 @@ class NodeMeta(type):
                 _stores[attr_name] = attr_value
         
         # Create the class
-        cls = super().__new__(mcs, name, bases, namespace)
+        cls = super().__new__(mcs, name, bases, namespace, **kwargs)
         
         # Attach registries to the class
         cls._input_ports = _input_ports
@@ -74,6 +76,16 @@ class NodeMeta(type):
         cls._actions = _actions
         cls._outputs = _outputs
         cls._stores = _stores
+        # Port names are fixed per class; the network reads these every step
+        cls._input_port_names = tuple(port.name for port in _input_ports.values())
+        cls._output_port_names = tuple(port.name for port in _output_ports.values())
+        # Schema parts that never change per class, shared by every instance
+        cls._static_schema = {
+            "input_ports": [port.to_spec() for port in _input_ports.values()],
+            "output_ports": [port.to_spec() for port in _output_ports.values()],
+            "actions": [{**action.to_spec(), "key": name} for name, action in _actions.items()],
+            "stores": [{**store.to_spec(), "key": name} for name, store in _stores.items()],
+        }
         init_fn = getattr(cls, "init", None)
         cls._uses_background_init = bool(
             callable(init_fn) and getattr(init_fn, "__background_init__", False)
@@ -107,6 +119,9 @@ class Node(metaclass=NodeMeta):
     
     # Set to True in subclasses to enable hot-reload functionality
     dynamic: bool = True
+    # Set to True in subclasses whose process() depends only on inputs and
+    # properties; the network then skips it while its inputs are unchanged
+    pure: bool = False
     _background_init_reserved_attrs = frozenset({
         "node_id",
         "node_type",
@@ -117,6 +132,20 @@ class Node(metaclass=NodeMeta):
         "_loading_error",
     })
     
+    def __init_subclass__(cls, *, branch: Optional[str] = None, **kwargs):
+        """
+        Register a subclass in the palette at class creation.
+        
+        Equivalent to decorating with @branch(path):
+        
+            class MyNoiseNode(Node, branch="Input/Noise"):
+                ...
+        """
+        super().__init_subclass__(**kwargs)
+        if branch is not None:
+            _register_branch(branch, cls)
+            cls._node_branch = branch
+
     def __init__(self, x: float = 0, y: float = 0):
         self.node_id: Optional[str] = None
         # Use class name as both stable type identifier and default display name.
@@ -126,7 +155,7 @@ class Node(metaclass=NodeMeta):
         
         # State
         self._output_enabled: Dict[str, bool] = {
-            name: True for name in getattr(self.__class__, "_outputs", {}).keys()
+            name: True for name in self.__class__._outputs.keys()
         }
         self._loading: bool = False
         self._loading_error: str = ""
@@ -179,42 +208,31 @@ class Node(metaclass=NodeMeta):
     def get_schema(self) -> dict:
         """
         Return the node's schema for the UI.
+
+        Ports, actions and stores come from the class's precomputed specs and
+        are shared between calls; treat them as read-only.
         """
-        # Input/output ports (for connections UI)
-        input_ports = [p.to_spec() for p in getattr(self.__class__, "_input_ports", {}).values()]
-        output_ports = [p.to_spec() for p in getattr(self.__class__, "_output_ports", {}).values()]
+        # Input/output ports (for connections UI), actions (buttons) and
+        # persisted stores (informational metadata) are fixed per class
+        static = self.__class__._static_schema
 
         # Properties (editable controls in the node body)
         properties = []
-        for name, prop in getattr(self.__class__, "_properties", {}).items():
+        for name, prop in self.__class__._properties.items():
             val = getattr(self, name)
             spec = prop.to_spec(val)
             spec["key"] = name
             properties.append(spec)
 
-        # Actions (buttons)
-        actions = []
-        for name, action in getattr(self.__class__, "_actions", {}).items():
-            spec = action.to_spec()
-            spec["key"] = name
-            actions.append(spec)
-
         # Output displays (visual/text outputs shown in the node body)
         outputs = []
-        for name, display in getattr(self.__class__, "_outputs", {}).items():
+        for name, display in self.__class__._outputs.items():
             val = getattr(self, name)
             spec = display.to_spec(val)
             spec["key"] = name
             spec["enabled"] = self._output_enabled.get(name, True)
             outputs.append(spec)
 
-        # Persisted stores (shown as informational metadata in the UI)
-        stores = []
-        for name, store in getattr(self.__class__, "_stores", {}).items():
-            spec = store.to_spec()
-            spec["key"] = name
-            stores.append(spec)
-
         return {
             "node_type": self.node_type,
             "node_id": self.node_id,
@@ -224,12 +242,12 @@ class Node(metaclass=NodeMeta):
             "loading": self._loading,
             "loading_error": self._loading_error,
             "category": getattr(self.__class__, "_node_branch", ""),
-            "input_ports": input_ports,
-            "output_ports": output_ports,
+            "input_ports": static["input_ports"],
+            "output_ports": static["output_ports"],
             "properties": properties,
-            "actions": actions,
+            "actions": static["actions"],
             "outputs": outputs,
-            "stores": stores,
+            "stores": static["stores"],
         }
 
     def to_dict(
@@ -252,7 +270,15 @@ class Node(metaclass=NodeMeta):
             if isinstance(val, np.ndarray):
                 if array_serializer is not None:
                     return array_serializer(val)
-                return {"_type": "ndarray", "data": val.tolist()}
+                if val.dtype.hasobject:
+                    return {"_type": "ndarray", "data": val.tolist()}
+                # Raw bytes instead of tolist(), which boxes every element
+                return {
+                    "_type": "ndarray",
+                    "dtype": val.dtype.str,
+                    "shape": list(val.shape),
+                    "data_b64": base64.b64encode(np.ascontiguousarray(val).tobytes()).decode("ascii"),
+                }
             if isinstance(val, np.generic):
                 return val.item()
             if isinstance(val, list):
@@ -299,6 +325,10 @@ class Node(metaclass=NodeMeta):
             if isinstance(val, dict):
                 val_type = val.get("_type")
                 if val_type == "ndarray":
+                    if "data_b64" in val:
+                        raw = base64.b64decode(val["data_b64"])
+                        # Copy so the restored array owns writable memory
+                        return np.frombuffer(raw, dtype=val["dtype"]).reshape(val["shape"]).copy()
                     return np.array(val["data"])
                 if val_type == "ndarray_ref" and callable(array_loader):
                     return array_loader(val)
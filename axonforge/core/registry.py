@@ -1,12 +1,28 @@
-from typing import Dict, List, Optional, TYPE_CHECKING
+from typing import Dict, List, Optional, Set, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .node import Node
 
 _node_registry: Dict[str, "Node"] = {}
 _connection_registry: List[dict] = []  # List of {from_node, from_output, to_node, to_input}
+# (from_node, from_output, to_node, to_input) of every registered connection
+_connection_set: Set[Tuple[str, str, str, str]] = set()
+# (to_node, to_input) -> connections feeding that input, in registry order
+_connections_by_input: Dict[Tuple[str, str], List[dict]] = {}
 # Monotonic counter to ensure globally unique node IDs within a server run
 _node_counter: int = 0
+# Bumped on every node/connection mutation so execution plans can be cached
+_graph_version: int = 0
+
+
+def _bump_graph_version():
+    global _graph_version
+    _graph_version += 1
+
+
+def get_graph_version() -> int:
+    """Get a counter that changes whenever nodes or connections change."""
+    return _graph_version
 
 
 def register_node(node: "Node") -> str:
@@ -16,13 +32,22 @@ def register_node(node: "Node") -> str:
     _node_counter += 1
     node.node_id = node_id
     _node_registry[node_id] = node
+    _bump_graph_version()
     return node_id
 
 
+def replace_node(node_id: str, node: "Node"):
+    """Swap the instance registered under an existing ID (e.g. hot reload)."""
+    node.node_id = node_id
+    _node_registry[node_id] = node
+    _bump_graph_version()
+
+
 def unregister_node(node_id: str):
     """Unregister a node by ID."""
     if node_id in _node_registry:
         del _node_registry[node_id]
+        _bump_graph_version()
 
 
 def get_node(node_id: str) -> Optional["Node"]:
@@ -37,49 +62,94 @@ def get_all_nodes() -> Dict[str, "Node"]:
 
 def clear_node_registry():
     """Clear the node registry (for testing)."""
-    global _node_registry, _connection_registry, _node_counter
+    global _node_registry, _connection_registry, _connection_set, _connections_by_input, _node_counter
     _node_registry = {}
     _connection_registry = []
+    _connection_set = set()
+    _connections_by_input = {}
     _node_counter = 0
+    _bump_graph_version()
 
 
 def add_connection(from_node: str, from_output: str, to_node: str, to_input: str) -> bool:
     """Add a connection between nodes."""
     # Check if connection already exists
-    for conn in _connection_registry:
-        if (conn["from_node"] == from_node and 
-            conn["from_output"] == from_output and
-            conn["to_node"] == to_node and
-            conn["to_input"] == to_input):
-            return False
+    key = (from_node, from_output, to_node, to_input)
+    if key in _connection_set:
+        return False
     
-    _connection_registry.append({
+    _connection_set.add(key)
+    conn = {
         "from_node": from_node,
         "from_output": from_output,
         "to_node": to_node,
         "to_input": to_input,
-    })
+    }
+    _connection_registry.append(conn)
+    _connections_by_input.setdefault((to_node, to_input), []).append(conn)
+    _bump_graph_version()
     return True
 
 
 def remove_connection(from_node: str, from_output: str, to_node: str, to_input: str) -> bool:
     """Remove a connection between nodes."""
-    global _connection_registry
+    key = (from_node, from_output, to_node, to_input)
+    if key not in _connection_set:
+        return False
     for i, conn in enumerate(_connection_registry):
         if (conn["from_node"] == from_node and 
             conn["from_output"] == from_output and
             conn["to_node"] == to_node and
             conn["to_input"] == to_input):
+            _connection_set.discard(key)
             _connection_registry.pop(i)
+            feeding = _connections_by_input[(to_node, to_input)]
+            feeding.remove(conn)
+            if not feeding:
+                del _connections_by_input[(to_node, to_input)]
+            _bump_graph_version()
             return True
     return False
 
 
+def remove_connections_for_node(node_id: str) -> List[dict]:
+    """Remove every connection into or out of a node in one pass; return them."""
+    global _connection_registry
+    kept: List[dict] = []
+    removed: List[dict] = []
+    for conn in _connection_registry:
+        if conn["from_node"] == node_id or conn["to_node"] == node_id:
+            removed.append(conn)
+        else:
+            kept.append(conn)
+    if not removed:
+        return removed
+
+    _connection_registry = kept
+    for conn in removed:
+        _connection_set.discard(
+            (conn["from_node"], conn["from_output"], conn["to_node"], conn["to_input"])
+        )
+        input_key = (conn["to_node"], conn["to_input"])
+        feeding = [c for c in _connections_by_input.get(input_key, ()) if c is not conn]
+        if feeding:
+            _connections_by_input[input_key] = feeding
+        else:
+            _connections_by_input.pop(input_key, None)
+    _bump_graph_version()
+    return removed
+
+
 def get_connections() -> List[dict]:
     """Get all connections."""
     return _connection_registry.copy()
 
 
+def get_connections_to(to_node: str, to_input: str) -> List[dict]:
+    """Get the connections feeding a specific node input."""
+    return list(_connections_by_input.get((to_node, to_input), ()))
+
+
 def get_connections_for_node(node_id: str) -> List[dict]:
     """Get all connections involving a specific node."""
     return [
@@ -1,19 +1,96 @@
-from typing import List, Optional, Dict, Any, Tuple, Set
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Callable, Deque, List, Optional, Dict, Any, Tuple, Set
 import numpy as np
+import operator
+import sys
 import traceback
+import weakref
 
 
 class NetworkError(Exception):
     """Exception raised when a node processing error occurs."""
-    def __init__(self, node_id: str, node_name: str, error: Exception, traceback_str: str):
+    def __init__(self, node_id: str, node_name: str, error: Exception, traceback_str: Optional[str] = None):
         self.node_id = node_id
         self.node_name = node_name
         self.error = error
-        self.traceback = traceback_str
+        self._traceback = traceback_str
         super().__init__(f"Node '{node_name}' ({node_id}) error: {error}")
+    
+    @property
+    def traceback(self) -> str:
+        """Formatted traceback of `error`, built on first access."""
+        if self._traceback is None:
+            self._traceback = "".join(traceback.format_exception(self.error))
+        return self._traceback
 
 from ..core.node import Node
-from ..core.registry import get_node, get_connections, get_all_nodes
+from ..core.registry import get_node, get_connections, get_all_nodes, get_graph_version
+
+
+# Separator for signal keys; never appears in node ids or port names
+_KEY_SEP = "\x1f"
+
+
+def signal_key(node_id: str, port: str) -> str:
+    """Return the interned `_signals_now` key for a node's output port."""
+    return sys.intern(f"{node_id}{_KEY_SEP}{port}")
+
+
+# Compiled step runners, one per node class (dropped with the class on reload)
+_step_runners: "weakref.WeakKeyDictionary[type, Callable]" = weakref.WeakKeyDictionary()
+
+
+def _get_step_runner(cls: type) -> Callable[[Node, Dict, Dict], Dict[str, Any]]:
+    """
+    Return a function that feeds, processes and collects one node of `cls`.
+    
+    The function is generated once per class with its port names written out,
+    so a step does plain attribute access instead of looping over the class's
+    port tuples. Equivalent to _set_node_inputs() followed by
+    _process_node_once().
+    """
+    runner = _step_runners.get(cls)
+    if runner is not None:
+        return runner
+    
+    input_names = cls._input_port_names
+    output_names = cls._output_port_names
+    if not all(name.isidentifier() for name in input_names + output_names):
+        # Ports attached under non-identifier names can't be inlined
+        def runner(node, signals, incoming):
+            for name in input_names:
+                source = incoming.get(name)
+                setattr(node, name, signals.get(source) if source else None)
+            if getattr(node, "_loading", False):
+                return {}
+            node.process()
+            outputs = {}
+            for name in output_names:
+                value = getattr(node, name, None)
+                if value is not None:
+                    outputs[name] = value
+            return outputs
+    else:
+        lines = ["def run(node, signals, incoming):", "    get = signals.get"]
+        for name in input_names:
+            lines.append(f"    source = incoming.get({name!r})")
+            lines.append(f"    node.{name} = get(source) if source else None")
+        lines.append("    if getattr(node, '_loading', False):")
+        lines.append("        return {}")
+        lines.append("    node.process()")
+        lines.append("    outputs = {}")
+        for name in output_names:
+            lines.append(f"    value = node.{name}")
+            lines.append("    if value is not None:")
+            lines.append(f"        outputs[{name!r}] = value")
+        lines.append("    return outputs")
+        namespace: Dict[str, Any] = {}
+        exec(compile("\n".join(lines), f"<step runner {cls.__qualname__}>", "exec"), namespace)
+        runner = namespace["run"]
+    
+    _step_runners[cls] = runner
+    return runner
 
 
 class Network:
@@ -23,11 +100,33 @@ class Network:
         self.running = False
         self.speed = 60
         self.max_speed = False
+        # Threads for running the independent nodes of a topological level
+        # concurrently; 1 runs every node on the calling thread
+        self.workers = 1
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_workers = 0
         self._step_count = 0
-        self._signals_now: Dict[Tuple[str, str], Any] = {}
+        # Keyed by signal_key(node_id, output_port)
+        self._signals_now: Dict[str, Any] = {}
         self.last_error: Optional[NetworkError] = None
         self.failed_nodes: Set[str] = set()  # Track nodes that failed processing
         self.failed_node_errors: Dict[str, str] = {}  # node_id -> latest error message
+        # Execution plan cached until the registry's graph version changes
+        self._plan_version = -1
+        self._sorted_nodes: List[Tuple[str, Node]] = []
+        self._levels: List[List[Tuple[str, Node]]] = []
+        self._incoming: Dict[str, Dict[str, str]] = {}
+        self._output_keys: Dict[str, Dict[str, str]] = {}
+        # Nodes whose outputs may have changed outside a step; every node is
+        # re-read once the graph changes after the last sync
+        self._dirty_nodes: Set[str] = set()
+        self._synced_version = -1
+        # Pure nodes: node_id -> (input signals, stored output signals) of
+        # their last run, replayed while the inputs are the same objects
+        self._input_cache: Dict[str, Tuple[tuple, Dict[str, Any]]] = {}
+        # node_id -> count of mark_dirty calls; a run only caches its result
+        # if no invalidation arrived while it was in flight
+        self._invalidations: Dict[str, int] = {}
     
     def start(self):
         self.running = True
@@ -36,6 +135,17 @@ class Network:
     def stop(self):
         self.running = False
     
+    def mark_dirty(self, node_id: str) -> None:
+        """
+        Have the next propagation re-read this node's outputs, and the next
+        step run it even if it is pure and its inputs are unchanged.
+        """
+        self._dirty_nodes.add(node_id)
+        # Bump before dropping the entry: a step that read the old count and
+        # stores its entry afterwards either sees the new count or is popped
+        self._invalidations[node_id] = self._invalidations.get(node_id, 0) + 1
+        self._input_cache.pop(node_id, None)
+    
     def clear_failed_nodes(self) -> None:
         """Clear all tracked failed-node state."""
         self.failed_nodes.clear()
@@ -52,57 +162,169 @@ class Network:
         
         Raises NetworkError if any node fails, and stops the network.
         """
-        nodes_by_id = get_all_nodes()
-        connections = get_connections()
-        
-        # Build incoming port mappings
-        incoming: Dict[str, Dict[str, Tuple[str, str]]] = {}
-        for conn in connections:
-            incoming.setdefault(conn["to_node"], {})[conn["to_input"]] = (conn["from_node"], conn["from_output"])
-        
-        # Get topological order (dependencies first)
-        sorted_nodes = self._topological_sort(nodes_by_id, connections)
+        sorted_nodes, incoming = self._get_execution_plan()
+        pool = self._get_pool()
         
         updated_nodes = set()
         
-        # Process nodes in topological order
-        for node_id, node in sorted_nodes:
-            # Set input values from _signals_now
-            # - Feedforward inputs: just stored by upstream nodes (current step)
-            # - Feedback inputs: from previous step (cycle can't be resolved)
-            self._set_node_inputs(node, incoming.get(node_id, {}))
+        signals = self._signals_now
+        no_incoming: Dict[str, str] = {}
+        
+        # Process nodes in topological order, level by level when threaded
+        for batch in (self._levels if pool is not None else (sorted_nodes,)):
+            runs = None
+            if pool is not None and len(batch) > 1:
+                # Nodes of one level don't feed each other: run them all, then
+                # store their outputs in order as if they had run one by one
+                futures = [
+                    pool.submit(self._run_node, node_id, node, signals, incoming.get(node_id, no_incoming))
+                    for node_id, node in batch
+                ]
+                wait(futures)
+                runs = [future.result for future in futures]
             
-            # Process the node (with error handling)
-            try:
-                node_outputs = self._process_node_once(node)
+            for index, (node_id, node) in enumerate(batch):
+                # Set inputs from _signals_now, then process (with error handling)
+                # - Feedforward inputs: just stored by upstream nodes (current step)
+                # - Feedback inputs: from previous step (cycle can't be resolved)
+                try:
+                    if runs is None:
+                        inputs, generation, node_outputs, replay = self._run_node(
+                            node_id, node, signals, incoming.get(node_id, no_incoming)
+                        )
+                    else:
+                        inputs, generation, node_outputs, replay = runs[index]()
+                except Exception as e:
+                    # Stop the network on error
+                    self.running = False
+                    self.failed_nodes.add(node_id)  # Track the failed node
+                    self.failed_node_errors[node_id] = str(e)
+                    self.last_error = NetworkError(
+                        node_id=node_id,
+                        node_name=node.name,
+                        error=e
+                    )
+                    # Re-raise so the caller can handle it
+                    raise self.last_error
+                
+                if replay is not None:
+                    # Pure node fed the very same signals as last run: replay its outputs
+                    self._signals_now.update(replay)
+                    continue
+                
                 # Clear this node from failed nodes if it succeeded
                 self.failed_nodes.discard(node_id)
                 self.failed_node_errors.pop(node_id, None)
-            except Exception as e:
-                # Stop the network on error
-                self.running = False
-                self.failed_nodes.add(node_id)  # Track the failed node
-                self.failed_node_errors[node_id] = str(e)
-                self.last_error = NetworkError(
-                    node_id=node_id,
-                    node_name=node.name,
-                    error=e,
-                    traceback_str=traceback.format_exc()
-                )
-                # Re-raise so the caller can handle it
-                raise self.last_error
-            
-            if not node_outputs:
-                continue
-            
-            # Store outputs IMMEDIATELY so downstream nodes can see them this step
-            for output_key, value in node_outputs.items():
-                self._signals_now[(node_id, output_key)] = self._clone_signal(value)
-            updated_nodes.add(node_id)
+                
+                # Store outputs IMMEDIATELY so downstream nodes can see them this step
+                keys = self._output_keys[node_id]
+                stored = {keys[output_key]: self._clone_signal(value) for output_key, value in node_outputs.items()}
+                if inputs is not None and not node._loading:
+                    # Store, then discard again if the node was marked dirty
+                    # while it ran: its outputs may predate the property edit
+                    self._input_cache[node_id] = (inputs, stored)
+                    if self._invalidations.get(node_id, 0) != generation:
+                        self._input_cache.pop(node_id, None)
+                
+                if not stored:
+                    continue
+                
+                self._signals_now.update(stored)
+                updated_nodes.add(node_id)
         
         self._step_count += 1
         return {"step": self._step_count, "updated_nodes": list(updated_nodes)}
     
+    def _run_node(self, node_id: str, node: Node, signals: Dict[str, Any],
+                  node_incoming: Dict[str, str]) -> Tuple[Optional[tuple], int, Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        Feed and process one node without touching _signals_now.
+        
+        Returns the input signals (pure nodes only), the node's invalidation
+        count read before it ran, its outputs, and - when a pure node's
+        cached outputs still apply - those stored signals to replay instead.
+        """
+        generation = self._invalidations.get(node_id, 0)
+        inputs = None
+        if node.pure:
+            inputs = tuple(map(signals.get, node_incoming.values()))
+            cached = self._input_cache.get(node_id)
+            if cached is not None and all(map(operator.is_, cached[0], inputs)):
+                return inputs, generation, None, cached[1]
+        return inputs, generation, _get_step_runner(node.__class__)(node, signals, node_incoming), None
+    
+    def _get_pool(self) -> Optional[ThreadPoolExecutor]:
+        """Return the level thread pool, (re)created to match `workers`."""
+        workers = int(self.workers)
+        pool = self._pool
+        if workers <= 1:
+            if pool is not None:
+                pool.shutdown(wait=False)
+                self._pool = None
+            return None
+        if pool is None or self._pool_workers != workers:
+            if pool is not None:
+                pool.shutdown(wait=False)
+            pool = self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="axonforge-step")
+            self._pool_workers = workers
+        return pool
+    
+    def _get_execution_plan(self) -> Tuple[List[Tuple[str, Node]], Dict[str, Dict[str, str]]]:
+        """
+        Return the topological order and incoming port mappings.
+        
+        Both only depend on the graph structure, so they are rebuilt only
+        when the registry reports a node or connection change, together with
+        the signal keys of every node's outputs.
+        """
+        version = get_graph_version()
+        if version != self._plan_version:
+            nodes_by_id = get_all_nodes()
+            connections = get_connections()
+            
+            # Build incoming port mappings
+            incoming: Dict[str, Dict[str, str]] = {}
+            for conn in connections:
+                incoming.setdefault(conn["to_node"], {})[conn["to_input"]] = signal_key(conn["from_node"], conn["from_output"])
+            
+            # Get topological order (dependencies first)
+            self._sorted_nodes = self._topological_sort(nodes_by_id, connections)
+            self._levels = self._group_levels(self._sorted_nodes, connections)
+            self._incoming = incoming
+            self._input_cache = {}
+            self._output_keys = {
+                nid: {name: signal_key(nid, name) for name in node.__class__._output_port_names}
+                for nid, node in nodes_by_id.items()
+            }
+            self._plan_version = version
+        return self._sorted_nodes, self._incoming
+    
+    def _group_levels(self, sorted_nodes: List[Tuple[str, Node]], connections: List[dict]) -> List[List[Tuple[str, Node]]]:
+        """
+        Split the topological order into levels of mutually independent nodes.
+        
+        A node's level is one past its deepest dependency. Nodes left over
+        from cycles keep their sorted position as single-node levels at the
+        end, so feedback still reads the previous step's signals.
+        """
+        dependencies: Dict[str, Set[str]] = {}
+        for conn in connections:
+            dependencies.setdefault(conn["to_node"], set()).add(conn["from_node"])
+        
+        depth: Dict[str, int] = {}
+        levels: List[List[Tuple[str, Node]]] = []
+        for node_id, node in sorted_nodes:
+            deps = dependencies.get(node_id, ())
+            if all(dep in depth for dep in deps):
+                level = max((depth[dep] + 1 for dep in deps), default=0)
+                depth[node_id] = level
+                if level == len(levels):
+                    levels.append([])
+                levels[level].append((node_id, node))
+            else:
+                levels.append([(node_id, node)])
+        return levels
+    
     def _topological_sort(self, nodes_by_id: Dict[str, Node], connections: List[dict]) -> List[Tuple[str, Node]]:
         """
         Sort nodes so dependencies are processed before dependents.
@@ -115,25 +337,33 @@ class Network:
             # conn["to_node"] depends on conn["from_node"]
             dependencies[conn["to_node"]].add(conn["from_node"])
         
+        # Reverse adjacency (node_id -> nodes depending on it, in node order)
+        # plus remaining dependency counts, so each edge is visited once
+        dependents: Dict[str, List[str]] = {}
+        remaining: Dict[str, int] = {}
+        for nid, deps in dependencies.items():
+            remaining[nid] = len(deps)
+            for dep in deps:
+                dependents.setdefault(dep, []).append(nid)
+        
         # Kahn's algorithm
         result: List[Tuple[str, Node]] = []
         # Nodes with no dependencies are ready to process
-        ready: List[str] = [nid for nid, deps in dependencies.items() if not deps]
+        ready: Deque[str] = deque(nid for nid, count in remaining.items() if not count)
         processed: Set[str] = set()
         
         while ready:
             # Take a node with no remaining dependencies
-            node_id = ready.pop(0)
+            node_id = ready.popleft()
             result.append((node_id, nodes_by_id[node_id]))
             processed.add(node_id)
             
-            # Remove this node from other nodes' dependencies
-            for nid, deps in dependencies.items():
-                if node_id in deps:
-                    deps.remove(node_id)
-                    # If all dependencies are satisfied, this node is ready
-                    if not deps and nid not in processed:
-                        ready.append(nid)
+            # Release the nodes that were waiting on this one
+            for nid in dependents.get(node_id, ()):
+                remaining[nid] -= 1
+                # If all dependencies are satisfied, this node is ready
+                if not remaining[nid] and nid not in processed:
+                    ready.append(nid)
         
         # Handle any remaining nodes (cycles) - add them at the end
         for nid in nodes_by_id:
@@ -147,17 +377,18 @@ class Network:
         connections = get_connections()
         self._sync_signals_from_nodes(nodes_by_id)
         
-        incoming: Dict[str, Dict[str, Tuple[str, str]]] = {}
+        incoming: Dict[str, Dict[str, str]] = {}
         outgoing: Dict[str, List[Tuple[str, str, str]]] = {}
         for conn in connections:
-            incoming.setdefault(conn["to_node"], {})[conn["to_input"]] = (conn["from_node"], conn["from_output"])
+            incoming.setdefault(conn["to_node"], {})[conn["to_input"]] = signal_key(conn["from_node"], conn["from_output"])
             outgoing.setdefault(conn["from_node"], []).append((conn["to_node"], conn["to_input"], conn["from_output"]))
         
-        queue: List[str] = [nid for nid in nodes_by_id if any(key[0] == nid for key in self._signals_now.keys())]
+        producers = {key.partition(_KEY_SEP)[0] for key in self._signals_now}
+        queue: Deque[str] = deque(nid for nid in nodes_by_id if nid in producers)
         queued = set(queue); processed = set(); updated_nodes = set()
         
         while queue:
-            source_node_id = queue.pop(0)
+            source_node_id = queue.popleft()
             for (target_node_id, _, _) in outgoing.get(source_node_id, []):
                 if target_node_id in processed: continue
                 target_node = nodes_by_id.get(target_node_id)
@@ -174,14 +405,13 @@ class Network:
                     self.last_error = NetworkError(
                         node_id=target_node_id,
                         node_name=target_node.name,
-                        error=e,
-                        traceback_str=traceback.format_exc()
+                        error=e
                     )
                     raise self.last_error
                 processed.add(target_node_id); updated_nodes.add(target_node_id)
                 
                 for output_key, value in node_outputs.items():
-                    self._signals_now[(target_node_id, output_key)] = self._clone_signal(value)
+                    self._signals_now[signal_key(target_node_id, output_key)] = self._clone_signal(value)
                 if target_node_id not in queued:
                     queue.append(target_node_id); queued.add(target_node_id)
         
@@ -191,15 +421,16 @@ class Network:
         nodes_by_id = get_all_nodes()
         if node_id not in nodes_by_id: return {"updated_nodes": []}
         connections = get_connections()
+        self.mark_dirty(node_id)
         self._sync_signals_from_nodes(nodes_by_id)
         
-        incoming: Dict[str, Dict[str, Tuple[str, str]]] = {}
+        incoming: Dict[str, Dict[str, str]] = {}
         outgoing: Dict[str, List[Tuple[str, str, str]]] = {}
         for conn in connections:
-            incoming.setdefault(conn["to_node"], {})[conn["to_input"]] = (conn["from_node"], conn["from_output"])
+            incoming.setdefault(conn["to_node"], {})[conn["to_input"]] = signal_key(conn["from_node"], conn["from_output"])
             outgoing.setdefault(conn["from_node"], []).append((conn["to_node"], conn["to_input"], conn["from_output"]))
         
-        processed, updated_nodes, queue, queued = set(), set(), [], set()
+        processed, updated_nodes, queue, queued = set(), set(), deque(), set()
         
         def enqueue(nid):
             if nid not in queued: queue.append(nid); queued.add(nid)
@@ -217,17 +448,16 @@ class Network:
                 self.last_error = NetworkError(
                     node_id=node_id,
                     node_name=start_node.name,
-                    error=e,
-                    traceback_str=traceback.format_exc()
+                    error=e
                 )
                 raise self.last_error
             processed.add(node_id); updated_nodes.add(node_id)
             for output_key, value in start_outputs.items():
-                self._signals_now[(node_id, output_key)] = self._clone_signal(value)
+                self._signals_now[signal_key(node_id, output_key)] = self._clone_signal(value)
         
         enqueue(node_id)
         while queue:
-            source_node_id = queue.pop(0)
+            source_node_id = queue.popleft()
             for (target_node_id, _, _) in outgoing.get(source_node_id, []):
                 if target_node_id in processed: continue
                 target_node = nodes_by_id.get(target_node_id)
@@ -244,14 +474,13 @@ class Network:
                     self.last_error = NetworkError(
                         node_id=target_node_id,
                         node_name=target_node.name,
-                        error=e,
-                        traceback_str=traceback.format_exc()
+                        error=e
                     )
                     raise self.last_error
                 processed.add(target_node_id); updated_nodes.add(target_node_id)
                 
                 for output_key, value in target_outputs.items():
-                    self._signals_now[(target_node_id, output_key)] = self._clone_signal(value)
+                    self._signals_now[signal_key(target_node_id, output_key)] = self._clone_signal(value)
                 enqueue(target_node_id)
         
         return {"updated_nodes": list(updated_nodes)}
@@ -262,31 +491,33 @@ class Network:
         self._step_count = 0
         self.running = False
         self._signals_now = {}
+        self._synced_version = -1
+        self._input_cache = {}
         self.failed_nodes.clear()
         self.failed_node_errors.clear()
         self.last_error = None
 
-    def _set_node_inputs(self, node: Node, incoming_ports: Dict[str, Tuple[str, str]]) -> None:
+    def _set_node_inputs(self, node: Node, incoming_ports: Dict[str, str]) -> None:
         """
         Set input values directly on the node instance via descriptor protocol.
         This allows nodes to access inputs via self.{port_name}.
         
         Also clears inputs that don't have connections to handle disconnections.
         """
-        for port in getattr(node.__class__, "_input_ports", {}).values():
-            source = incoming_ports.get(port.name)
+        for name in node.__class__._input_port_names:
+            source = incoming_ports.get(name)
             if source:
                 v = self._signals_now.get(source)
-                setattr(node, port.name, v)  # Set value (could be None if signal not yet available)
+                setattr(node, name, v)  # Set value (could be None if signal not yet available)
             else:
                 # No connection to this port - clear any stale value
-                setattr(node, port.name, None)
+                setattr(node, name, None)
 
     def _process_node_once(self, node: Node) -> Dict[str, Any]:
         """Process a node and return its outputs."""
         if getattr(node, "_loading", False):
             return {}
-        output_keys = [p.name for p in getattr(node.__class__, "_output_ports", {}).values()]
+        output_keys = node.__class__._output_port_names
         
         # Call process() with no arguments
         node.process()
@@ -303,8 +534,8 @@ class Network:
         """Process a node for probing (during paused state)."""
         if getattr(node, "_loading", False):
             return {}
-        output_keys = [p.name for p in getattr(node.__class__, "_output_ports", {}).values()]
-        input_keys = [p.name for p in getattr(node.__class__, "_input_ports", {}).values()]
+        output_keys = node.__class__._output_port_names
+        input_keys = node.__class__._input_port_names
         
         # For nodes with no inputs, just process
         if not input_keys:
@@ -325,14 +556,30 @@ class Network:
         return outputs
 
     def _sync_signals_from_nodes(self, nodes_by_id) -> None:
-        """Sync signals from nodes that have output values set."""
-        for node_id, node in nodes_by_id.items():
+        """
+        Sync signals from nodes that have output values set.
+        
+        Steps and propagations store every output they produce, so only
+        nodes marked dirty need re-reading, unless the graph changed since
+        the last sync (new, loaded or reloaded nodes) or signals were reset.
+        """
+        version = get_graph_version()
+        if version != self._synced_version:
+            node_ids = nodes_by_id.keys()
+            self._synced_version = version
+        else:
+            node_ids = self._dirty_nodes
+        for node_id in node_ids:
+            node = nodes_by_id.get(node_id)
+            if node is None:
+                continue
             for output_key, value in self._read_node_outputs(node).items():
-                self._signals_now[(node_id, output_key)] = self._clone_signal(value)
+                self._signals_now[signal_key(node_id, output_key)] = self._clone_signal(value)
+        self._dirty_nodes = set()
 
     def _read_node_outputs(self, node: Node) -> Dict[str, Any]:
         """Read outputs from OutputPort descriptors."""
-        output_keys = [p.name for p in getattr(node.__class__, "_output_ports", {}).values()]
+        output_keys = node.__class__._output_port_names
         outputs = {}
         for key in output_keys:
             val = getattr(node, key, None)
@@ -341,6 +588,10 @@ class Network:
         return outputs
 
     def _clone_signal(self, value: Any) -> Any:
-        # No copying - assumes nodes don't mutate inputs in-place
-        # If a node mutates shared data, the entire graph can be corrupted
+        # No copying - arrays are shared with every consumer through a
+        # read-only view, so a node mutating its input in place fails loudly
+        # instead of silently corrupting the graph
+        if isinstance(value, np.ndarray) and value.flags.writeable:
+            value = value.view()
+            value.flags.writeable = False
         return value
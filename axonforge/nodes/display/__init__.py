@@ -21,8 +21,8 @@ class DisplayVector(Node):
             self.info = "No data"
             return
 
-        # Flatten to 1D
-        arr = self.input_data.flatten().astype(np.float32)
+        # Flatten to 1D; a float32 vector input passes through uncopied
+        arr = self.input_data.ravel().astype(np.float32, copy=False)
 
         # Set outputs - pass input directly to display
         self.output_data = arr
@@ -126,13 +126,13 @@ class PlotBar(Node):
             # Convert input to float
             float_value = float(self.input_value)
             
-            # Shift content left and add new value at the end
-            if self.history_count > 0:
-                # Shift existing values left
-                self.history[:-1] = self.history[1:]
-            
-            # Add new value at the end
-            self.history[-1] = float_value
+            # Shift content left and add new value at the end, into a fresh
+            # array: the previous history may still be on display, and the
+            # new one can be displayed without another copy
+            history = np.empty_like(self.history)
+            history[:-1] = self.history[1:]
+            history[-1] = float_value
+            self.history = history
             
             # Increment count, but cap at max_len
             if self.history_count < max_len:
@@ -144,7 +144,7 @@ class PlotBar(Node):
             if self.history_count < max_len:
                 display_array = self.history[-self.history_count:]
             else:
-                display_array = self.history.copy()
+                display_array = self.history
             self.plot = display_array
             
             # Calculate and display min/max
@@ -282,13 +282,13 @@ class PlotLine(Node):
             # Convert input to float
             float_value = float(self.input_value)
             
-            # Shift content left and add new value at the end
-            if self.history_count > 0:
-                # Shift existing values left
-                self.history[:-1] = self.history[1:]
-            
-            # Add new value at the end
-            self.history[-1] = float_value
+            # Shift content left and add new value at the end, into a fresh
+            # array: the previous history may still be on display, and the
+            # new one can be displayed without another copy
+            history = np.empty_like(self.history)
+            history[:-1] = self.history[1:]
+            history[-1] = float_value
+            self.history = history
             
             # Increment count, but cap at max_len
             if self.history_count < max_len:
@@ -300,7 +300,7 @@ class PlotLine(Node):
             if self.history_count < max_len:
                 display_array = self.history[-self.history_count:]
             else:
-                display_array = self.history.copy()
+                display_array = self.history
             self.plot = display_array
             
             # Calculate and display min/max
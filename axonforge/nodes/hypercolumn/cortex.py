@@ -30,13 +30,15 @@ class Reconstruct(Node):
         if self.weights is None or self.activations is None:
             return
 
-        W = self.weights  # (n, D)
+        W = np.ascontiguousarray(self.weights)  # (n, D)
         a = self.activations  # (k, k) or any shape with n total elements
 
         n, D = W.shape
-        a_flat = a.flatten().astype(np.float64)  # (n,)
+        # Match the weights' precision so float32 weights aren't upcast
+        a_flat = np.asarray(a, dtype=W.dtype).ravel()  # (n,)
 
-        x_recon = W.T @ a_flat
+        # a @ W == W.T @ a; a plain row-major GEMV with no transposed operand
+        x_recon = a_flat @ W
 
         side = int(np.sqrt(D))
         x_recon_2d = x_recon.reshape(side, side)
@@ -43,14 +43,27 @@ class HyperColumn(Node):
     def init(self):
         self.weights: Optional[np.ndarray] = self._initialize_weights()
         self.delta_rot = self.calculate_delta_rot_matrix()
-        self.error_map = np.zeros(self.input_len**2)
-        self.beta_per_neuron = np.full(self.minicolumn_count, self.beta)
+        self.error_map = np.zeros(self.input_len**2, dtype=np.float32)
+        self.beta_per_neuron = np.full(self.minicolumn_count, self.beta, dtype=np.float32)
+        self._allocate_scratch()
 
     # ── Weight helpers ─────────────────────────────────────────────────
 
+    def _allocate_scratch(self):
+        # Per-step intermediates that are never published, so they can be
+        # reused; sized to the current weights
+        m, d = self.weights.shape
+        self._x_norm = np.empty(d, dtype=np.float32)
+        self._s_raw = np.empty(m, dtype=np.float32)
+        self._x_hat = np.empty(d, dtype=np.float32)
+        self._dots = np.empty(m, dtype=np.float32)
+        self._e_perp = np.empty_like(self.weights)
+
     def _initialize_weights(self):
 
-        weights = np.random.randn(self.minicolumn_count, self.input_len**2)
+        # Single precision is plenty for the rotational rule and halves the
+        # memory traffic of every matmul over the weights
+        weights = np.random.randn(self.minicolumn_count, self.input_len**2).astype(np.float32)
 
         norms = np.linalg.norm(weights, axis=1, keepdims=True) + 1e-8
         weights = weights / norms
@@ -64,8 +77,9 @@ class HyperColumn(Node):
         self.delta_rot = self.calculate_delta_rot_matrix()
         self.weights_display = to_display_grid(self.weights)
         self.delta_rot_display = self.delta_rot
-        self.error_map = np.zeros(self.input_len**2)
-        self.beta_per_neuron = np.full(self.minicolumn_count, self.beta)
+        self.error_map = np.zeros(self.input_len**2, dtype=np.float32)
+        self.beta_per_neuron = np.full(self.minicolumn_count, self.beta, dtype=np.float32)
+        self._allocate_scratch()
 
         return {"status": "ok"}
 
@@ -76,25 +90,25 @@ class HyperColumn(Node):
             return
 
         ######## INPUT ########
-        x: np.ndarray = self.i_input.flatten()
-        norm = np.linalg.norm(x) + 1e-8
-        x_norm = x / norm
+        x: np.ndarray = np.asarray(self.i_input, dtype=np.float32).ravel()
+        if x.size != self._x_norm.size:
+            # The scratch would broadcast a mismatched input instead of failing
+            raise ValueError(
+                f"Expected an input of {self._x_norm.size} values, got {x.size}"
+            )
+        norm = math.sqrt(float(x @ x)) + 1e-8
+        # x may be a read-only view of the input, so divide into the scratch
+        x_norm = np.divide(x, norm, out=self._x_norm)
 
         ######## FEEDFORWARD ########
-        s_raw = x_norm @ self.weights.T
+        s_raw = np.matmul(x_norm, self.weights.T, out=self._s_raw)
 
-        s_final = (
-            s_raw
-            - (
-                self.beta_per_neuron[:, None]
-                * self.delta_rot
-                * self.beta_per_neuron[None, :]
-            )
-            @ s_raw
-        )
+        # (diag(b) · D · diag(b)) @ s  ==  b * (D @ (b * s)), without the m×m temporaries
+        beta = self.beta_per_neuron
+        s_final = s_raw - beta * (self.delta_rot @ (beta * s_raw))
 
         ######## RECONSTRUCTION ########
-        x_hat = self.weights.T @ s_final
+        x_hat = np.matmul(self.weights.T, s_final, out=self._x_hat)
 
         ######## ERROR TERMS ########
 
@@ -103,7 +117,7 @@ class HyperColumn(Node):
 
         # Activation alignment error (hierarchical consistency)
         if self.i_feedback is not None:
-            f = self.i_feedback
+            f = np.asarray(self.i_feedback, dtype=np.float32)
 
             # Normalize activation + feedback for structural alignment
             s_hat = s_final / (np.linalg.norm(s_final) + 1e-8)
@@ -114,16 +128,25 @@ class HyperColumn(Node):
             # Backproject to pixel space
             e_rep_pix = self.weights.T @ e_act
         else:
-            e_rep_pix = np.zeros_like(e_pix)
+            e_rep_pix = None
 
         ######## MIXED ERROR ########
 
-        error = (1 - self.feedback_ratio) * e_pix + self.feedback_ratio * e_rep_pix
+        error = (1 - self.feedback_ratio) * e_pix
+        if e_rep_pix is not None:
+            # Without feedback the second term is zero; skip building it
+            error += self.feedback_ratio * e_rep_pix
 
-        error_norm = error / (np.linalg.norm(error) + 1e-8)
+        # error is a fresh temporary, so normalize it in place
+        error /= np.linalg.norm(error) + 1e-8
+        error_norm = error
 
         ######## ADAPT INHIBITION (optional modulation) ########
-        self.error_map = self.gamma * self.error_map + (1 - self.gamma) * error_norm
+        # Accumulated into a fresh array (one temporary fewer) rather than in
+        # place, since the display reshapes the previous map as a view
+        error_map = self.gamma * self.error_map
+        error_map += (1 - self.gamma) * error_norm
+        self.error_map = error_map
         error_map_norm = self.error_map / (np.linalg.norm(self.error_map) + 1e-8)
 
         error_alignment = self.weights @ error_map_norm
@@ -134,24 +157,26 @@ class HyperColumn(Node):
         if self.is_learning:
 
             # projection of error onto weights
-            dots = self.weights @ error_norm
+            dots = np.matmul(self.weights, error_norm, out=self._dots)
 
-            # perpendicular component
-            e_perp = error_norm - dots[:, None] * self.weights
+            # perpendicular component (built in the preallocated M×D buffer)
+            e_perp = np.multiply(dots[:, None], self.weights, out=self._e_perp)
+            np.subtract(error_norm, e_perp, out=e_perp)
 
-            norms = np.linalg.norm(e_perp, axis=1, keepdims=True) + 1e-8
-            e_perp_hat = e_perp / norms
+            e_perp /= np.linalg.norm(e_perp, axis=1, keepdims=True) + 1e-8
 
             # rotate proportional to activation magnitude
             theta = self.alpha * s_final
 
-            self.weights = (
-                np.cos(theta)[:, None] * self.weights
-                + np.sin(theta)[:, None] * e_perp_hat
-            )
+            # cos·W + sin·ê accumulated into the new weights; the published
+            # array is replaced, never written, since outputs share it
+            weights = np.cos(theta)[:, None] * self.weights
+            e_perp *= np.sin(theta)[:, None]
+            weights += e_perp
 
             # re-normalize to stay on unit sphere
-            self.weights /= np.linalg.norm(self.weights, axis=1, keepdims=True) + 1e-8
+            weights /= np.linalg.norm(weights, axis=1, keepdims=True) + 1e-8
+            self.weights = weights
 
             self.delta_rot = self.calculate_delta_rot_matrix()
 
@@ -170,8 +195,9 @@ class HyperColumn(Node):
         self.log = ""
 
     def calculate_delta_rot_matrix(self):
-        dots = self.weights @ self.weights.T
-        delta_rot = np.clip(dots, 0.0, 1.0)
+        # BLAS matmul beats einsum here; clip the fresh Gram matrix in place
+        delta_rot = self.weights @ self.weights.T
+        np.clip(delta_rot, 0.0, 1.0, out=delta_rot)
         np.fill_diagonal(delta_rot, 0.0)
         return delta_rot
 
@@ -181,7 +207,7 @@ class HyperColumn(Node):
 
         ####### PROCESS ########
 
-        x: np.ndarray = self.i_input.flatten()
+        x: np.ndarray = self.i_input.ravel()
         norm = np.linalg.norm(x) + 1e-8
         x_norm = x / norm
 
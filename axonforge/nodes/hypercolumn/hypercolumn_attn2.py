@@ -10,6 +10,7 @@ from axonforge.core.descriptors.properties import Range, Integer, Bool, Float
 from axonforge.core.descriptors.displays import Vector2D, Text
 from axonforge.core.descriptors.actions import Action
 from axonforge.core.descriptors import branch
+from axonforge.nodes.hypercolumn.utilities import to_display_grid, scale_to_bwr
 
 """Lowercase Greek letters:
 
@@ -76,7 +77,7 @@ class HyperColumnAttn2(Node):
         return h
 
     def preprocess_input(self):
-        x = self.i_input.flatten()
+        x = self.i_input.ravel()
         x_norm_factor = np.linalg.norm(x) + EPS
         x_norm = x / x_norm_factor
         return x, x_norm_factor, x_norm
@@ -95,7 +96,7 @@ class HyperColumnAttn2(Node):
 
         # optional: only allow inhibitory connections to be nonnegative
         # (anti-correlated templates shouldn't "help" via negative inhibition)
-        S = np.maximum(S, 0.0)
+        np.maximum(S, 0.0, out=S)
 
         # 3) inhibition driven by who is active
         k = self.beta  # use beta as inhibition strength (or any scalar)
@@ -109,10 +110,12 @@ class HyperColumnAttn2(Node):
         return s_final @ self.weights
 
     def update_density_map(self, density_map_target):
-        self.dens_pix = (
-            1.0 - self.dens_momentum
-        ) * self.dens_pix + self.dens_momentum * (density_map_target * self.err_scale)
-        self.dens_pix /= np.mean(self.dens_pix) + EPS
+        # EMA updated in place: the map is never published directly (the
+        # display rescales a copy), and the two scalars fold into one
+        dens = self.dens_pix
+        dens *= 1.0 - self.dens_momentum
+        dens += (self.dens_momentum * self.err_scale) * density_map_target
+        dens /= np.mean(dens) + EPS
 
     def calculate_density_i(self):
         w_mask = np.abs(self.weights)
@@ -121,19 +124,18 @@ class HyperColumnAttn2(Node):
         return dens_i
 
 
-
     def process(self):
         if self.i_input is None:
             return
 
 
         # --- input ---
-        x = self.i_input.flatten().astype(np.float32)
+        x = np.asarray(self.i_input, dtype=np.float32).ravel()
         x_norm_scale = np.linalg.norm(x)
         x_norm = x / (x_norm_scale + EPS)
 
-        # keep unit templates
-        self.weights /= (np.linalg.norm(self.weights, axis=1, keepdims=True) + EPS)
+        # keep unit templates (rebound, since last step published this array)
+        self.weights = self.weights / (np.linalg.norm(self.weights, axis=1, keepdims=True) + EPS)
 
         # --- activations (your competition; keep as-is or simpler) ---
         s_raw, s_final = self.calculate_activations(x_norm)     # (M,), (M,)
@@ -175,72 +177,3 @@ class HyperColumnAttn2(Node):
         self.weights_display = to_display_grid(self.weights)
         self.activation_final = to_display_grid(s_final)
         self.density_display = scale_to_bwr(self.dens_pix.reshape(self.input_len, self.input_len))
-
-
-def to_display_grid(arr):
-    """Convert 1D or 2D array to a square-ish 2D array for display.
-
-    For 1D arrays: reshape into a near-square 2D array.
-    For 2D arrays (weights matrix): create a mosaic of weight patches.
-    """
-    import numpy as np
-
-    if arr.ndim == 1:
-        n = len(arr)
-        # Find dimensions for a near-square rectangle
-        h = int(np.ceil(np.sqrt(n)))
-        w = int(np.ceil(n / h))
-        # Pad with zeros if needed
-        padded = np.zeros(h * w, dtype=arr.dtype)
-        padded[:n] = arr
-        return padded.reshape(h, w)
-    elif arr.ndim == 2:
-        M, D = arr.shape
-        # Check if D is a perfect square (for weight patches)
-        sqrt_D = int(np.sqrt(D))
-        if sqrt_D * sqrt_D == D:
-            # This is a weight matrix with square patches
-            H = sqrt_D
-            W = sqrt_D
-            S = int(np.ceil(np.sqrt(M)))
-            total = S * S
-            pad = total - M
-
-            weights = arr
-            if pad > 0:
-                weights = np.vstack([weights, np.zeros((pad, D), dtype=weights.dtype)])
-
-            mosaic = (
-                weights.reshape(S, S, H, W).transpose(0, 2, 1, 3).reshape(S * H, S * W)
-            )
-            return mosaic
-        else:
-            # Not a square patch matrix, just reshape to near-square
-            n = M * D
-            h = int(np.ceil(np.sqrt(n)))
-            w = int(np.ceil(n / h))
-            flattened = arr.flatten()
-            padded = np.zeros(h * w, dtype=arr.dtype)
-            padded[:n] = flattened
-            return padded.reshape(h, w)
-    else:
-        # Return as-is for other dimensions
-        return arr
-
-def scale_to_bwr(arr):
-    """Scale array values to [-1, 1] range for full bwr color utilization.
-
-    Uses min-max normalization: values are linearly mapped from [min, max]
-    to [-1, 1]. This ensures unit vectors and other normalized data use
-    the full blue-white-red color range instead of appearing whitish.
-    """
-    arr = np.asarray(arr)
-    min_val = arr.min()
-    max_val = arr.max()
-
-    if max_val == min_val:
-        # Constant array - return zeros to show as white/neutral
-        return np.zeros_like(arr)
-
-    # Scale to [-1, 1]: 2 * (x - min) / (max - min) - 1
-    return 2 * (arr - min_val) / (max_val - min_val) - 1
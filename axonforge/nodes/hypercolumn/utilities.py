@@ -5,6 +5,9 @@ def to_display_grid(arr):
 
     For 1D arrays: reshape into a near-square 2D array.
     For 2D arrays (weights matrix): create a mosaic of weight patches.
+
+    When no padding is needed the result is a view of `arr` rather than a
+    copy, so callers must not modify `arr` in place afterwards.
     """
     import numpy as np
 
@@ -13,6 +16,8 @@ def to_display_grid(arr):
         # Find dimensions for a near-square rectangle
         h = int(np.ceil(np.sqrt(n)))
         w = int(np.ceil(n / h))
+        if h * w == n:
+            return arr.reshape(h, w)
         # Pad with zeros if needed
         padded = np.zeros(h * w, dtype=arr.dtype)
         padded[:n] = arr
@@ -26,23 +31,24 @@ def to_display_grid(arr):
             H = sqrt_D
             W = sqrt_D
             S = int(np.ceil(np.sqrt(M)))
-            total = S * S
-            pad = total - M
-
-            weights = arr
-            if pad > 0:
-                weights = np.vstack([weights, np.zeros((pad, D), dtype=weights.dtype)])
 
-            mosaic = (
-                weights.reshape(S, S, H, W).transpose(0, 2, 1, 3).reshape(S * H, S * W)
-            )
+            # Write the patches straight into the mosaic through a
+            # (row, col, H, W) view; missing patches stay zero
+            mosaic = np.zeros((S * H, S * W), dtype=arr.dtype)
+            tiles = mosaic.reshape(S, H, S, W).transpose(0, 2, 1, 3)
+            full_rows, rest = divmod(M, S)
+            tiles[:full_rows] = arr[: full_rows * S].reshape(full_rows, S, H, W)
+            if rest:
+                tiles[full_rows, :rest] = arr[full_rows * S :].reshape(rest, H, W)
             return mosaic
         else:
             # Not a square patch matrix, just reshape to near-square
             n = M * D
             h = int(np.ceil(np.sqrt(n)))
             w = int(np.ceil(n / h))
-            flattened = arr.flatten()
+            flattened = arr.ravel()
+            if h * w == n:
+                return flattened.reshape(h, w)
             padded = np.zeros(h * w, dtype=arr.dtype)
             padded[:n] = flattened
             return padded.reshape(h, w)
@@ -65,5 +71,9 @@ def scale_to_bwr(arr):
         # Constant array - return zeros to show as white/neutral
         return np.zeros_like(arr)
 
-    # Scale to [-1, 1]: 2 * (x - min) / (max - min) - 1
-    return 2 * (arr - min_val) / (max_val - min_val) - 1
+    # Scale to [-1, 1]: 2 * (x - min) / (max - min) - 1, applied in place
+    # to the single fresh (floating) array the subtraction creates
+    scaled = np.subtract(arr, min_val, dtype=np.result_type(arr, 1.0))
+    scaled *= 2 / (max_val - min_val)
+    scaled -= 1
+    return scaled
@@ -243,20 +243,19 @@ class Uniformity(Node):
         if self.input_data is None:
             return
 
-        flat = self.input_data.flatten().astype(np.float64)
+        v = self.input_data.ravel().astype(np.float32, copy=False)
         
-        # Normalize to L2
-        norm = np.linalg.norm(flat)
-        if norm > 0:
-            v = flat / norm
-        else:
+        # The L2-normalized vector squared is v² / Σv²; no sqrt needed
+        v2 = v * v
+        total = v2.sum()
+        if total <= 0:
             self.uniformity = 0.0
             self.display = 0.0
             self.info = "Zero vector"
             return
         
         # Compute probability distribution
-        p = v ** 2
+        p = v2 / total
         
         # Compute entropy
         entropy = -np.sum(p * np.log(p + 1e-9))
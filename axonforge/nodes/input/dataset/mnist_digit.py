@@ -9,7 +9,7 @@ from ....core.descriptors.properties import Integer, Range
 from ....core.descriptors.displays import Vector2D, Text
 from ....core.descriptors.store import Store
 from ....core.descriptors import branch
-from ....nodes.utilities import _load_dataset_with_python_mnist
+from ....nodes.utilities import _load_dataset_with_python_mnist, _MNIST_PIXEL_MAX
 
 
 
@@ -42,6 +42,18 @@ class InputDigitMNIST(Node):
                 self._class_indices[digit] = np.where(self._labels == digit)[0]
         self._update_pattern()
 
+    def export_background_init_state(self):
+        # The dataset is a memory-mapped, process-wide cache; reopen it in the
+        # receiving process instead of pickling every image across
+        state = super().export_background_init_state()
+        state.pop("_images", None)
+        state.pop("_labels", None)
+        return state
+
+    def apply_background_init_state(self, state):
+        super().apply_background_init_state(state)
+        self._images, self._labels = _load_dataset_with_python_mnist("mnist")
+
     def process(self):
         if self._images is not None:
             # Increment repeat counter
@@ -64,8 +76,12 @@ class InputDigitMNIST(Node):
 
     def _update_pattern(self):
         if self._images is not None:
-            self.output_pattern = self._images[self.idx]
-            self.pattern = self._images[self.idx]
-            self.output_digit = int(self._labels[self.idx])
-            self.digit = str(self._labels[self.idx])
+            # Scale the uint8 sample to a fresh float32 image (784 values),
+            # shared by the port and the display
+            image = self._images[self.idx] / _MNIST_PIXEL_MAX
+            label = int(self._labels[self.idx])
+            self.output_pattern = image
+            self.pattern = image
+            self.output_digit = label
+            self.digit = str(label)
 
@@ -5,7 +5,7 @@ from ....core.descriptors.ports import InputPort, OutputPort
 from ....core.descriptors.displays import Vector2D, Text
 from ....core.descriptors.store import Store
 from ....core.descriptors import branch
-from ....nodes.utilities import _load_dataset_with_python_mnist
+from ....nodes.utilities import _load_dataset_with_python_mnist, _MNIST_PIXEL_MAX
 
 
 class InputFashionMNIST(Node):
@@ -37,6 +37,18 @@ class InputFashionMNIST(Node):
         self._images, self._labels = _load_dataset_with_python_mnist("fashion_mnist")
         self._update_pattern()
 
+    def export_background_init_state(self):
+        # The dataset is a memory-mapped, process-wide cache; reopen it in the
+        # receiving process instead of pickling every image across
+        state = super().export_background_init_state()
+        state.pop("_images", None)
+        state.pop("_labels", None)
+        return state
+
+    def apply_background_init_state(self, state):
+        super().apply_background_init_state(state)
+        self._images, self._labels = _load_dataset_with_python_mnist("fashion_mnist")
+
     def process(self):
         if self._images is not None:
             self.idx = (self.idx + 1) % len(self._images)
@@ -44,8 +56,11 @@ class InputFashionMNIST(Node):
 
     def _update_pattern(self):
         if self._images is not None:
-            self.output_pattern = self._images[self.idx]
-            self.pattern = self._images[self.idx]
+            # Scale the uint8 sample to a fresh float32 image (784 values),
+            # shared by the port and the display
+            image = self._images[self.idx] / _MNIST_PIXEL_MAX
+            self.output_pattern = image
+            self.pattern = image
             l = int(self._labels[self.idx])
             self.output_category = l
             self.info = (
@@ -15,7 +15,7 @@ from ....core.node import Node, background_init
 from ....core.descriptors.ports import InputPort, OutputPort
 from ....core.descriptors.displays import Vector2D, Text
 from ....core.descriptors.store import Store
-from ....nodes.utilities import _load_dataset_with_python_mnist
+from ....nodes.utilities import _load_dataset_with_python_mnist, _MNIST_PIXEL_MAX
 
 
 class MNISTRepresentative(Node):
@@ -80,7 +80,7 @@ class MNISTRepresentative(Node):
             
             if len(digit_images) > 0:
                 # Compute mean image (average of all images for this digit)
-                mean_image = np.mean(digit_images, axis=0)
+                mean_image = np.mean(digit_images, axis=0, dtype=np.float32) / _MNIST_PIXEL_MAX
                 self._representative_images[digit] = mean_image
             else:
                 # Fallback: empty image if no data (shouldn't happen with MNIST)
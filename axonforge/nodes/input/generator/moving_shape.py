@@ -1,5 +1,7 @@
 """Generator input nodes for MiniCortex - synthetic pattern generators."""
 
+import math
+
 import numpy as np
 
 from ....core.node import Node
@@ -39,6 +41,8 @@ class InputMovingShape(Node):
     target_y = Store(default=0.0)
 
     def init(self):
+        # (grid_size, y_coords, x_coords) of the last rendered grid
+        self._coords = None
         self._generate_new_target()
         self._update_pattern()
 
@@ -58,7 +62,7 @@ class InputMovingShape(Node):
         # Calculate distance to target
         dx = target_x - current_x
         dy = target_y - current_y
-        dist = np.sqrt(dx * dx + dy * dy)
+        dist = math.hypot(dx, dy)
         
         # Check if we've reached the target
         if dist < speed:
@@ -79,21 +83,25 @@ class InputMovingShape(Node):
         self.target_x = np.random.uniform(margin, grid_size - margin - 1)
         self.target_y = np.random.uniform(margin, grid_size - margin - 1)
 
+    # Easing curves by interpolation mode; unknown modes fall back to linear
+    _INTERPOLATIONS = {
+        "Linear": lambda t: t,
+        "Ease In": lambda t: t * t,
+        "Ease Out": lambda t: 1 - (1 - t) * (1 - t),
+        "Ease In-Out": lambda t: 2 * t * t if t < 0.5 else 1 - 2 * (1 - t) * (1 - t),
+    }
+
     def _apply_interpolation(self, t):
         """Apply interpolation function based on selected mode."""
-        interp_mode = self.interpolation
-        if interp_mode == "Linear":
-            return t
-        elif interp_mode == "Ease In":
-            return t * t
-        elif interp_mode == "Ease Out":
-            return 1 - (1 - t) * (1 - t)
-        elif interp_mode == "Ease In-Out":
-            if t < 0.5:
-                return 2 * t * t
-            else:
-                return 1 - 2 * (1 - t) * (1 - t)
-        return t
+        ease = self._INTERPOLATIONS.get(self.interpolation)
+        return t if ease is None else ease(t)
+
+    def _coordinate_grids(self, grid_size):
+        """Return (y_coords, x_coords), rebuilt only when the grid size changes."""
+        coords = self._coords
+        if coords is None or coords[0] != grid_size:
+            coords = self._coords = (grid_size, *np.ogrid[:grid_size, :grid_size])
+        return coords[1], coords[2]
 
     def _update_pattern(self):
         grid_size = int(self.grid_size)
@@ -102,30 +110,35 @@ class InputMovingShape(Node):
         pos_y = float(self.pos_y)
 
         # Create coordinate grids
-        y_coords, x_coords = np.ogrid[:grid_size, :grid_size]
+        y_coords, x_coords = self._coordinate_grids(grid_size)
         
         if self.shape_type == "Square":
-            # Calculate distance from edges for anti-aliasing
+            # Calculate distance from edges for anti-aliasing; the per-axis
+            # profiles are a single row and column, clipped in place
             half_size = shape_size / 2.0
-            dx = np.abs(x_coords - pos_x)
-            dy = np.abs(y_coords - pos_y)
+            dist_x = half_size - np.abs(x_coords - pos_x)
+            dist_y = half_size - np.abs(y_coords - pos_y)
+            np.clip(dist_x, 0.0, 1.0, out=dist_x)
+            np.clip(dist_y, 0.0, 1.0, out=dist_y)
             
-            # Anti-aliased square
-            dist_x = half_size - dx
-            dist_y = half_size - dy
-            pattern = np.minimum(np.clip(dist_x, 0.0, 1.0), np.clip(dist_y, 0.0, 1.0))
+            # Anti-aliased square, broadcast straight into the float32 grid
+            pattern = np.empty((grid_size, grid_size), dtype=np.float32)
+            np.minimum(dist_x, dist_y, out=pattern)
         else:  # Circle
             # Calculate distance from center
             dx = x_coords - pos_x
             dy = y_coords - pos_y
-            dist = np.sqrt(dx * dx + dy * dy)
+            dist = np.hypot(dx, dy)
             
-            # Anti-aliased circle
+            # Anti-aliased circle, reusing the distance grid
             radius = shape_size / 2.0
-            pattern = np.clip(radius - dist, 0.0, 1.0)
+            pattern = np.subtract(radius, dist, out=dist)
+            np.clip(pattern, 0.0, 1.0, out=pattern)
 
-        self.output_pattern = pattern.astype(np.float32)
-        self.pattern = pattern.astype(np.float32)
+        # One cast (none for the square), shared by the output port and the display
+        pattern = pattern.astype(np.float32, copy=False)
+        self.output_pattern = pattern
+        self.pattern = pattern
         
         # Update info
         px = int(pos_x)
@@ -1,5 +1,7 @@
 """Generator input nodes for MiniCortex - synthetic pattern generators."""
 
+import math
+
 import numpy as np
 
 from ....core.node import Node
@@ -40,6 +42,8 @@ class InputRotatingLine(Node):
     start_angle = Store(default=0.0)
 
     def init(self):
+        # (size, rx, ry) of the last rendered grid
+        self._coords = None
         self._generate_new_target()
         self._update_pattern()
 
@@ -82,46 +86,52 @@ class InputRotatingLine(Node):
         """Generate a new random target angle."""
         self.target_angle = np.random.uniform(0, 2 * np.pi)
 
+    # Easing curves by interpolation mode; unknown modes fall back to linear
+    _INTERPOLATIONS = {
+        "Linear": lambda t: t,
+        "Ease In": lambda t: t * t,
+        "Ease Out": lambda t: 1 - (1 - t) * (1 - t),
+        "Ease In-Out": lambda t: 2 * t * t if t < 0.5 else 1 - 2 * (1 - t) * (1 - t),
+    }
+
     def _apply_interpolation(self, t):
         """Apply interpolation function based on selected mode."""
-        interp_mode = self.interpolation
-        if interp_mode == "Linear":
-            return t
-        elif interp_mode == "Ease In":
-            return t * t
-        elif interp_mode == "Ease Out":
-            return 1 - (1 - t) * (1 - t)
-        elif interp_mode == "Ease In-Out":
-            if t < 0.5:
-                return 2 * t * t
-            else:
-                return 1 - 2 * (1 - t) * (1 - t)
-        return t
+        ease = self._INTERPOLATIONS.get(self.interpolation)
+        return t if ease is None else ease(t)
+
+    def _coordinate_grids(self, size):
+        """Return centered (rx, ry) grids, rebuilt only when the size changes."""
+        coords = self._coords
+        if coords is None or coords[0] != size:
+            # Create coordinate grids centered at the middle
+            y_coords, x_coords = np.ogrid[:size, :size]
+            cx, cy = size / 2.0, size / 2.0
+            coords = self._coords = (size, x_coords - cx, y_coords - cy)
+        return coords[1], coords[2]
 
     def _update_pattern(self):
         size = int(self.size)
         thickness = int(self.thickness)
         angle = float(self.angle)
 
-        # Create coordinate grids centered at the middle
-        y_coords, x_coords = np.ogrid[:size, :size]
-        cx, cy = size / 2.0, size / 2.0
-        rx = x_coords - cx
-        ry = y_coords - cy
+        rx, ry = self._coordinate_grids(size)
 
         # Calculate perpendicular distance to the line through center at given angle
         # Line direction: (cos(angle), sin(angle))
         # Perpendicular distance: |rx * sin(angle) - ry * cos(angle)|
-        line_dx = np.cos(angle)
-        line_dy = np.sin(angle)
+        # Scalar trig on a Python float; np.cos/np.sin would box it first
+        line_dx = math.cos(angle)
+        line_dy = math.sin(angle)
         perp_dist = np.abs(rx * line_dy - ry * line_dx)
 
         # Create line pattern with anti-aliasing at edges
         half_thickness = thickness / 2.0
         pattern = np.clip(half_thickness - perp_dist, 0.0, 1.0)
 
-        self.output_pattern = pattern.astype(np.float32)
-        self.pattern = pattern.astype(np.float32)
+        # One cast, shared by the output port and the display
+        pattern = pattern.astype(np.float32)
+        self.output_pattern = pattern
+        self.pattern = pattern
         
         # Output angle in degrees (0-360)
         angle_deg = np.degrees(angle) % 360.0
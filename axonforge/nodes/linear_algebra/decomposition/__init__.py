@@ -15,6 +15,8 @@ class SVD(Node):
     Outputs: U, singular values S, and V transpose.
     """
 
+    pure = True
+
     input_data = InputPort("Input", np.ndarray)
     output_u = OutputPort("U", np.ndarray)
     output_s = OutputPort("S (singular values)", np.ndarray)
@@ -46,6 +48,8 @@ class EigenDecomposition(Node):
     Outputs: eigenvalues D (diagonal) and eigenvectors V.
     """
 
+    pure = True
+
     input_data = InputPort("Input", np.ndarray)
     output_eigenvalues = OutputPort("Eigenvalues", np.ndarray)
     output_eigenvectors = OutputPort("Eigenvectors", np.ndarray)
@@ -79,6 +83,8 @@ class QRDecomposition(Node):
     Where Q is orthonormal and R is upper triangular.
     """
 
+    pure = True
+
     input_data = InputPort("Input", np.ndarray)
     output_q = OutputPort("Q", np.ndarray)
     output_r = OutputPort("R", np.ndarray)
@@ -12,6 +12,8 @@ from axonforge.core.descriptors import branch
 class MatrixTranspose(Node):
     """Transpose a matrix."""
 
+    pure = True
+
     input_data = InputPort("Input", np.ndarray)
     output = OutputPort("Output", np.ndarray)
     
@@ -28,6 +30,8 @@ class MatrixTranspose(Node):
 class MatrixMultiply(Node):
     """Matrix multiplication (A @ B)."""
 
+    pure = True
+
     input_a = InputPort("A", np.ndarray)
     input_b = InputPort("B", np.ndarray)
     output = OutputPort("Result", np.ndarray)
@@ -40,7 +44,7 @@ class MatrixMultiply(Node):
             return
 
         try:
-            self.output = (self.input_a @ self.input_b).astype(np.float32)
+            self.output = (self.input_a @ self.input_b).astype(np.float32, copy=False)
             self.info = f"{self.input_a.shape} @ {self.input_b.shape} → {self.output.shape}"
         except Exception as e:
             self.info = f"Error: {e}"
@@ -49,6 +53,8 @@ class MatrixMultiply(Node):
 class MatrixDeterminant(Node):
     """Compute determinant of a square matrix."""
 
+    pure = True
+
     input_data = InputPort("Input", np.ndarray)
     determinant = OutputPort("Determinant", float)
     
@@ -69,6 +75,8 @@ class MatrixDeterminant(Node):
 class MatrixInverse(Node):
     """Compute inverse of a square matrix."""
 
+    pure = True
+
     input_data = InputPort("Input", np.ndarray)
     output = OutputPort("Inverse", np.ndarray)
     
@@ -80,7 +88,7 @@ class MatrixInverse(Node):
 
         try:
             inv = np.linalg.inv(self.input_data)
-            self.output = inv.astype(np.float32)
+            self.output = inv.astype(np.float32, copy=False)
             self.info = f"Inverse computed"
         except Exception as e:
             self.info = f"Error: {e}"
@@ -135,6 +143,8 @@ class MatrixOnes(Node):
 class MatrixReshape(Node):
     """Reshape a matrix to new dimensions."""
 
+    pure = True
+
     input_data = InputPort("Input", np.ndarray)
     output = OutputPort("Output", np.ndarray)
     
@@ -170,6 +180,8 @@ class MatrixReshape(Node):
 class MatrixFlatten(Node):
     """Flatten a matrix to 1D."""
 
+    pure = True
+
     input_data = InputPort("Input", np.ndarray)
     output = OutputPort("Output", np.ndarray)
     
@@ -179,7 +191,7 @@ class MatrixFlatten(Node):
         if self.input_data is None:
             return
 
-        self.output = self.input_data.flatten().astype(np.float32)
+        self.output = self.input_data.ravel().astype(np.float32)
         self.info = f"{self.input_data.shape} → {self.output.shape}"
 
 
@@ -190,6 +202,8 @@ class MatrixTransposeProjection(Node):
     activations back through transposed weights.
     """
 
+    pure = True
+
     weights = InputPort("Weights (W)", np.ndarray)
     input_data = InputPort("Input (x)", np.ndarray)
     output = OutputPort("Output (W.T @ x)", np.ndarray)
@@ -202,11 +216,12 @@ class MatrixTransposeProjection(Node):
             return
 
         try:
-            # Flatten input if needed to ensure 1D vector
-            x = self.input_data.flatten()
+            # Flatten input if needed to ensure 1D vector (a view when
+            # contiguous; the product below is a fresh array either way)
+            x = self.input_data.ravel()
             # Compute W.T @ x
             result = self.weights.T @ x
-            self.output = result.astype(np.float32)
+            self.output = result.astype(np.float32, copy=False)
             self.info = f"{self.weights.shape}.T @ {x.shape} → {self.output.shape}"
         except Exception as e:
             self.info = f"Error: {e}"
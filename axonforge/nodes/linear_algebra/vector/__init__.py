@@ -10,7 +10,9 @@ from axonforge.core.descriptors import branch
 
 
 class L2Normalize(Node):
-    """L2 normalize a numpy array. Flattens if required, then reshapes to original shape."""
+    """L2 normalize a numpy array over all of its elements, keeping its shape."""
+
+    pure = True
 
     input_data = InputPort("Input", np.ndarray)
     output_data = OutputPort("Output", np.ndarray)
@@ -22,23 +24,21 @@ class L2Normalize(Node):
         if self.input_data is None:
             return
 
-        # Store original shape
-        original_shape = self.input_data.shape
+        x = self.input_data
+        original_shape = x.shape
 
-        # Flatten the array for L2 normalization
-        flat = self.input_data.flatten().astype(np.float64)
-
-        # Compute L2 norm
-        l2_norm = np.linalg.norm(flat)
+        # Compute L2 norm over all elements, in the input's own precision;
+        # no flatten/reshape round trip is needed
+        l2_norm = float(np.linalg.norm(x.ravel()))
 
         # Normalize (avoid division by zero)
         if l2_norm > 0:
-            normalized = flat / l2_norm
+            normalized = x / l2_norm
         else:
-            normalized = flat
+            normalized = x
 
         # Set outputs
-        self.output_data = normalized.reshape(original_shape).astype(np.float32)
+        self.output_data = normalized.astype(np.float32, copy=False)
         self.norm_value = float(l2_norm)
         self.info = f"Norm: {l2_norm:.4f}, Shape: {original_shape}"
 
@@ -46,6 +46,8 @@ class L2Normalize(Node):
 class L1Normalize(Node):
     """L1 normalize a numpy array."""
 
+    pure = True
+
     input_data = InputPort("Input", np.ndarray)
     output_data = OutputPort("Output", np.ndarray)
     
@@ -74,6 +76,8 @@ class L1Normalize(Node):
 class MinMaxNormalize(Node):
     """Min-max normalize array to [0, 1] range."""
 
+    pure = True
+
     input_data = InputPort("Input", np.ndarray)
     output_data = OutputPort("Output", np.ndarray)
     
@@ -85,18 +89,20 @@ class MinMaxNormalize(Node):
         if self.input_data is None:
             return
 
-        original_shape = self.input_data.shape
-        flat = self.input_data.flatten().astype(np.float64)
+        # Element-wise, so no flatten is needed; float32 throughout
+        x = np.asarray(self.input_data, dtype=np.float32)
         
-        min_v = np.min(flat)
-        max_v = np.max(flat)
+        min_v = float(x.min())
+        max_v = float(x.max())
         
         if max_v > min_v:
-            normalized = (flat - min_v) / (max_v - min_v)
+            # One fresh float32 array, rescaled in place
+            normalized = x - np.float32(min_v)
+            normalized /= np.float32(max_v - min_v)
         else:
-            normalized = flat
+            normalized = x
         
-        self.output_data = normalized.reshape(original_shape).astype(np.float32)
+        self.output_data = normalized
         self.min_val = float(min_v)
         self.max_val = float(max_v)
         self.info = f"Range: [{min_v:.4f}, {max_v:.4f}]"
@@ -105,6 +111,8 @@ class MinMaxNormalize(Node):
 class VectorScale(Node):
     """Scale a vector by a scalar value."""
 
+    pure = True
+
     input_vector = InputPort("Input", np.ndarray)
     output_vector = OutputPort("Output", np.ndarray)
     
@@ -126,6 +134,8 @@ class VectorScale(Node):
 class VectorMagnitude(Node):
     """Compute the L2 magnitude/length of a vector."""
 
+    pure = True
+
     input_data = InputPort("Input", np.ndarray)
     magnitude = OutputPort("Magnitude", float)
     
@@ -147,6 +157,8 @@ class VectorMagnitude(Node):
 class VectorDotProduct(Node):
     """Compute dot product of two vectors."""
 
+    pure = True
+
     input_a = InputPort("A", np.ndarray)
     input_b = InputPort("B", np.ndarray)
     output = OutputPort("Dot Product", float)
@@ -176,6 +188,8 @@ class VectorDotProduct(Node):
 class VectorCrossProduct(Node):
     """Compute cross product of two 3D vectors."""
 
+    pure = True
+
     input_a = InputPort("A", np.ndarray)
     input_b = InputPort("B", np.ndarray)
     output = OutputPort("Result", np.ndarray)
@@ -202,6 +216,8 @@ class VectorCrossProduct(Node):
 class VectorDistance(Node):
     """Compute Euclidean distance between two vectors."""
 
+    pure = True
+
     input_a = InputPort("A", np.ndarray)
     input_b = InputPort("B", np.ndarray)
     distance = OutputPort("Distance", float)
@@ -231,6 +247,8 @@ class VectorDistance(Node):
 class VectorAngle(Node):
     """Compute angle between two vectors in radians."""
 
+    pure = True
+
     input_a = InputPort("A", np.ndarray)
     input_b = InputPort("B", np.ndarray)
     angle = OutputPort("Angle (rad)", float)
@@ -266,6 +284,8 @@ class VectorAngle(Node):
 class VectorCosineSimilarity(Node):
     """Compute cosine similarity between two vectors."""
 
+    pure = True
+
     input_a = InputPort("A", np.ndarray)
     input_b = InputPort("B", np.ndarray)
     similarity = OutputPort("Cosine Similarity", float)
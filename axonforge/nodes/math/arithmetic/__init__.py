@@ -12,6 +12,8 @@ from axonforge.core.descriptors import branch
 class Add(Node):
     """Add two inputs element-wise."""
 
+    pure = True
+
     input_a = InputPort("A", np.ndarray)
     input_b = InputPort("B", np.ndarray)
     output = OutputPort("Result", np.ndarray)
@@ -23,13 +25,15 @@ class Add(Node):
             self.info = "Waiting for inputs"
             return
         
-        self.output = (self.input_a + self.input_b).astype(np.float32)
+        self.output = (self.input_a + self.input_b).astype(np.float32, copy=False)
         self.info = f"Shape: {self.output.shape}"
 
 
 class Subtract(Node):
     """Subtract second input from first."""
 
+    pure = True
+
     input_a = InputPort("A", np.ndarray)
     input_b = InputPort("B", np.ndarray)
     output = OutputPort("Result", np.ndarray)
@@ -41,13 +45,15 @@ class Subtract(Node):
             self.info = "Waiting for inputs"
             return
         
-        self.output = (self.input_a - self.input_b).astype(np.float32)
+        self.output = (self.input_a - self.input_b).astype(np.float32, copy=False)
         self.info = f"Shape: {self.output.shape}"
 
 
 class Multiply(Node):
     """Multiply two inputs element-wise."""
 
+    pure = True
+
     input_a = InputPort("A", np.ndarray)
     input_b = InputPort("B", np.ndarray)
     output = OutputPort("Result", np.ndarray)
@@ -59,13 +65,15 @@ class Multiply(Node):
             self.info = "Waiting for inputs"
             return
         
-        self.output = (self.input_a * self.input_b).astype(np.float32)
+        self.output = (self.input_a * self.input_b).astype(np.float32, copy=False)
         self.info = f"Shape: {self.output.shape}"
 
 
 class Divide(Node):
     """Divide first input by second."""
 
+    pure = True
+
     input_a = InputPort("A", np.ndarray)
     input_b = InputPort("B", np.ndarray)
     output = OutputPort("Result", np.ndarray)
@@ -79,13 +87,15 @@ class Divide(Node):
             return
         
         eps = float(self.epsilon)
-        self.output = (self.input_a / (self.input_b + eps)).astype(np.float32)
+        self.output = (self.input_a / (self.input_b + eps)).astype(np.float32, copy=False)
         self.info = f"Shape: {self.output.shape}"
 
 
 class Power(Node):
     """Raise input to a power."""
 
+    pure = True
+
     input_data = InputPort("Input", np.ndarray)
     output = OutputPort("Result", np.ndarray)
     
@@ -97,13 +107,15 @@ class Power(Node):
             return
         
         exp = float(self.exponent)
-        self.output = (np.power(self.input_data, exp)).astype(np.float32)
+        self.output = (np.power(self.input_data, exp)).astype(np.float32, copy=False)
         self.info = f"x^{exp}"
 
 
 class SquareRoot(Node):
     """Compute square root."""
 
+    pure = True
+
     input_data = InputPort("Input", np.ndarray)
     output = OutputPort("Result", np.ndarray)
     
@@ -113,13 +125,15 @@ class SquareRoot(Node):
         if self.input_data is None:
             return
         
-        self.output = np.sqrt(np.maximum(0, self.input_data)).astype(np.float32)
+        self.output = np.sqrt(np.maximum(0, self.input_data)).astype(np.float32, copy=False)
         self.info = f"Shape: {self.output.shape}"
 
 
 class Absolute(Node):
     """Compute absolute value."""
 
+    pure = True
+
     input_data = InputPort("Input", np.ndarray)
     output = OutputPort("Result", np.ndarray)
     
@@ -129,13 +143,15 @@ class Absolute(Node):
         if self.input_data is None:
             return
         
-        self.output = np.abs(self.input_data).astype(np.float32)
+        self.output = np.abs(self.input_data).astype(np.float32, copy=False)
         self.info = f"Shape: {self.output.shape}"
 
 
 class Negative(Node):
     """Negate input."""
 
+    pure = True
+
     input_data = InputPort("Input", np.ndarray)
     output = OutputPort("Result", np.ndarray)
     
@@ -145,13 +161,15 @@ class Negative(Node):
         if self.input_data is None:
             return
         
-        self.output = (-self.input_data).astype(np.float32)
+        self.output = (-self.input_data).astype(np.float32, copy=False)
         self.info = f"Shape: {self.output.shape}"
 
 
 class Modulo(Node):
     """Compute modulo operation."""
 
+    pure = True
+
     input_a = InputPort("A", np.ndarray)
     input_b = InputPort("B", np.ndarray)
     output = OutputPort("Result", np.ndarray)
@@ -165,13 +183,15 @@ class Modulo(Node):
         
         # Avoid division by zero
         b = np.where(self.input_b == 0, 1, self.input_b)
-        self.output = (self.input_a % b).astype(np.float32)
+        self.output = (self.input_a % b).astype(np.float32, copy=False)
         self.info = f"Shape: {self.output.shape}"
 
 
 class Clip(Node):
     """Clip values to a range."""
 
+    pure = True
+
     input_data = InputPort("Input", np.ndarray)
     output = OutputPort("Result", np.ndarray)
     
@@ -185,5 +205,5 @@ class Clip(Node):
         
         min_v = float(self.min_val)
         max_v = float(self.max_val)
-        self.output = np.clip(self.input_data, min_v, max_v).astype(np.float32)
+        self.output = np.clip(self.input_data, min_v, max_v).astype(np.float32, copy=False)
         self.info = f"Clipped to [{min_v}, {max_v}]"
@@ -12,6 +12,8 @@ from axonforge.core.descriptors import branch
 class GreaterThan(Node):
     """Return 1 where a > b, else 0."""
 
+    pure = True
+
     input_a = InputPort("A", np.ndarray)
     input_b = InputPort("B", np.ndarray)
     output = OutputPort("Result", np.ndarray)
@@ -30,6 +32,8 @@ class GreaterThan(Node):
 class LessThan(Node):
     """Return 1 where a < b, else 0."""
 
+    pure = True
+
     input_a = InputPort("A", np.ndarray)
     input_b = InputPort("B", np.ndarray)
     output = OutputPort("Result", np.ndarray)
@@ -48,6 +52,8 @@ class LessThan(Node):
 class GreaterEqual(Node):
     """Return 1 where a >= b, else 0."""
 
+    pure = True
+
     input_a = InputPort("A", np.ndarray)
     input_b = InputPort("B", np.ndarray)
     output = OutputPort("Result", np.ndarray)
@@ -66,6 +72,8 @@ class GreaterEqual(Node):
 class LessEqual(Node):
     """Return 1 where a <= b, else 0."""
 
+    pure = True
+
     input_a = InputPort("A", np.ndarray)
     input_b = InputPort("B", np.ndarray)
     output = OutputPort("Result", np.ndarray)
@@ -84,6 +92,8 @@ class LessEqual(Node):
 class Equal(Node):
     """Return 1 where a == b, else 0."""
 
+    pure = True
+
     input_a = InputPort("A", np.ndarray)
     input_b = InputPort("B", np.ndarray)
     output = OutputPort("Result", np.ndarray)
@@ -102,6 +112,8 @@ class Equal(Node):
 class NotEqual(Node):
     """Return 1 where a != b, else 0."""
 
+    pure = True
+
     input_a = InputPort("A", np.ndarray)
     input_b = InputPort("B", np.ndarray)
     output = OutputPort("Result", np.ndarray)
@@ -120,6 +132,8 @@ class NotEqual(Node):
 class Maximum(Node):
     """Element-wise maximum of two inputs."""
 
+    pure = True
+
     input_a = InputPort("A", np.ndarray)
     input_b = InputPort("B", np.ndarray)
     output = OutputPort("Result", np.ndarray)
@@ -138,6 +152,8 @@ class Maximum(Node):
 class Minimum(Node):
     """Element-wise minimum of two inputs."""
 
+    pure = True
+
     input_a = InputPort("A", np.ndarray)
     input_b = InputPort("B", np.ndarray)
     output = OutputPort("Result", np.ndarray)
@@ -12,6 +12,8 @@ from axonforge.core.descriptors import branch
 class Sin(Node):
     """Compute sine."""
 
+    pure = True
+
     input_data = InputPort("Input", np.ndarray)
     output = OutputPort("Result", np.ndarray)
     
@@ -28,6 +30,8 @@ class Sin(Node):
 class Cos(Node):
     """Compute cosine."""
 
+    pure = True
+
     input_data = InputPort("Input", np.ndarray)
     output = OutputPort("Result", np.ndarray)
     
@@ -44,6 +48,8 @@ class Cos(Node):
 class Tan(Node):
     """Compute tangent."""
 
+    pure = True
+
     input_data = InputPort("Input", np.ndarray)
     output = OutputPort("Result", np.ndarray)
     
@@ -60,6 +66,8 @@ class Tan(Node):
 class Asin(Node):
     """Compute arcsine."""
 
+    pure = True
+
     input_data = InputPort("Input", np.ndarray)
     output = OutputPort("Result", np.ndarray)
     
@@ -78,6 +86,8 @@ class Asin(Node):
 class Acos(Node):
     """Compute arccosine."""
 
+    pure = True
+
     input_data = InputPort("Input", np.ndarray)
     output = OutputPort("Result", np.ndarray)
     
@@ -96,6 +106,8 @@ class Acos(Node):
 class Atan(Node):
     """Compute arctangent."""
 
+    pure = True
+
     input_data = InputPort("Input", np.ndarray)
     output = OutputPort("Result", np.ndarray)
     
@@ -112,6 +124,8 @@ class Atan(Node):
 class Atan2(Node):
     """Compute arctangent of two inputs (y, x)."""
 
+    pure = True
+
     input_y = InputPort("Y", np.ndarray)
     input_x = InputPort("X", np.ndarray)
     output = OutputPort("Result", np.ndarray)
@@ -130,6 +144,8 @@ class Atan2(Node):
 class DegreesToRadians(Node):
     """Convert degrees to radians."""
 
+    pure = True
+
     input_data = InputPort("Degrees", np.ndarray)
     output = OutputPort("Radians", np.ndarray)
     
@@ -146,6 +162,8 @@ class DegreesToRadians(Node):
 class RadiansToDegrees(Node):
     """Convert radians to degrees."""
 
+    pure = True
+
     input_data = InputPort("Radians", np.ndarray)
     output = OutputPort("Degrees", np.ndarray)
     
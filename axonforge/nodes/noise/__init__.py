@@ -1,5 +1,7 @@
 """Noise generator nodes for MiniCortex."""
 
+import math
+
 import numpy as np
 from typing import Optional
 
@@ -9,6 +11,28 @@ from axonforge.core.descriptors.properties import Range, Integer
 from axonforge.core.descriptors.store import Store
 from axonforge.core.descriptors import branch
 
+# Upper bound on the (points, H, W) distance block NoiseWorley builds at once
+_WORLEY_BATCH_ELEMENTS = 1 << 22
+
+# Pixel offsets of the 3x3 anti-aliased dot NoiseBlue stamps at each point,
+# and the dot's value at each: 1 - 0.5 * distance
+_BLUE_NOISE_DY, _BLUE_NOISE_DX = np.mgrid[-1:2, -1:2].reshape(2, -1)
+_BLUE_NOISE_DOT = (
+    1.0 - 0.5 * np.hypot(_BLUE_NOISE_DY, _BLUE_NOISE_DX)
+).astype(np.float32)
+
+
+def _noise_scratch(node: Node, shape) -> np.ndarray:
+    """Return the node's float32 noise buffer, reallocated on shape change.
+
+    The buffer never leaves process(); only the sum with the input is
+    published, so it can be overwritten every step.
+    """
+    scratch = node._scratch
+    if scratch is None or scratch.shape != shape:
+        scratch = node._scratch = np.empty(shape, dtype=np.float32)
+    return scratch
+
 
 class NoiseGaussian(Node):
     """Add Gaussian (normal) noise to input array."""
@@ -26,14 +50,21 @@ class NoiseGaussian(Node):
 
     def init(self):
         self._rng = np.random.default_rng(int(self.seed) if self.seed else None)
+        # float32 noise buffer, reused while the input shape stays the same
+        self._scratch = None
 
     def process(self):
         if self.input_data is None:
             return
         mean = float(self.mean)
         std = float(self.std)
-        noise = self._rng.normal(mean, std, self.input_data.shape)
-        self.output = (self.input_data + noise).astype(np.float32)
+        noise = _noise_scratch(self, self.input_data.shape)
+        self._rng.standard_normal(dtype=np.float32, out=noise)
+        noise *= std
+        # Zero mean (the default) needs no shift pass
+        if mean:
+            noise += mean
+        self.output = np.add(self.input_data, noise, dtype=np.float32)
 
 
 class NoiseUniform(Node):
@@ -52,14 +83,19 @@ class NoiseUniform(Node):
 
     def init(self):
         self._rng = np.random.default_rng(int(self.seed) if self.seed else None)
+        # float32 noise buffer, reused while the input shape stays the same
+        self._scratch = None
 
     def process(self):
         if self.input_data is None:
             return
         low = float(self.low)
         high = float(self.high)
-        noise = self._rng.uniform(low, high, self.input_data.shape)
-        self.output = (self.input_data + noise).astype(np.float32)
+        noise = _noise_scratch(self, self.input_data.shape)
+        self._rng.random(dtype=np.float32, out=noise)
+        noise *= high - low
+        noise += low
+        self.output = np.add(self.input_data, noise, dtype=np.float32)
 
 
 class NoisePerlin(Node):
@@ -96,10 +132,11 @@ class NoisePerlin(Node):
         persistence = float(self.persistence)
         intensity = float(self.intensity)
         
-        # Generate base gradients
+        # Generate base gradients; float32 tables keep every full-grid
+        # temporary below in single precision
         def generate_gradients(grid_size):
             angles = self._rng.uniform(0, 2 * np.pi, (grid_size, grid_size))
-            return np.cos(angles), np.sin(angles)
+            return np.cos(angles).astype(np.float32), np.sin(angles).astype(np.float32)
         
         def fade(t):
             return t * t * t * (t * (t * 6 - 15) + 10)
@@ -108,31 +145,31 @@ class NoisePerlin(Node):
             return a + t * (b - a)
         
         def gradient(gx, gy, x, y, grid_sz):
-            # Get grid cell coordinates
-            x0, y0 = int(x), int(y)
-            x1, y1 = x0 + 1, y0 + 1
+            # Evaluated for the whole grid at once: x is a (1, W) row of
+            # column coordinates, y an (H, 1) column of row coordinates
+            # Get grid cell coordinates (coordinates are non-negative, so
+            # the integer cast is the floor)
+            x0, y0 = x.astype(np.intp), y.astype(np.intp)
+            
+            # Relative position within cell, reusing the truncated cells;
+            # the offsets to the far corners are taken once per octave. Cells
+            # come from the float64 coordinates, offsets are float32 rows
+            sx, sy = (x - x0).astype(np.float32), (y - y0).astype(np.float32)
+            sx1, sy1 = sx - 1, sy - 1
             
             # Wrap coordinates
+            x1, y1 = (x0 + 1) % grid_sz, (y0 + 1) % grid_sz
             x0, y0 = x0 % grid_sz, y0 % grid_sz
-            x1, y1 = x1 % grid_sz, y1 % grid_sz
-            
-            # Relative position within cell
-            sx, sy = x - int(x), y - int(y)
             
             # Fade curves
             u, v = fade(sx), fade(sy)
             
-            # Gradients at corners
-            g00 = gx[y0, x0], gy[y0, x0]
-            g01 = gx[y1, x0], gy[y1, x0]
-            g10 = gx[y0, x1], gy[y0, x1]
-            g11 = gx[y1, x1], gy[y1, x1]
-            
-            # Dot products
-            n00 = g00[0] * sx + g00[1] * sy
-            n01 = g01[0] * sx + g01[1] * (sy - 1)
-            n10 = g10[0] * (sx - 1) + g10[1] * sy
-            n11 = g11[0] * (sx - 1) + g11[1] * (sy - 1)
+            # Dot products with the corner gradients, gathered directly
+            # rather than through (gx, gy) tuples
+            n00 = gx[y0, x0] * sx + gy[y0, x0] * sy
+            n01 = gx[y1, x0] * sx + gy[y1, x0] * sy1
+            n10 = gx[y0, x1] * sx1 + gy[y0, x1] * sy
+            n11 = gx[y1, x1] * sx1 + gy[y1, x1] * sy1
             
             # Interpolate
             nx0 = lerp(n00, n10, u)
@@ -148,11 +185,9 @@ class NoisePerlin(Node):
         for _ in range(octaves):
             gx, gy = generate_gradients(freq + 1)
             
-            for i in range(size_y):
-                for j in range(size_x):
-                    x = j * freq / size_x
-                    y = i * freq / size_y
-                    noise[i, j] += amplitude * gradient(gx, gy, x, y, freq + 1)
+            x = (np.arange(size_x) * freq / size_x)[None, :]
+            y = (np.arange(size_y) * freq / size_y)[:, None]
+            noise += amplitude * gradient(gx, gy, x, y, freq + 1)
             
             max_amplitude += amplitude
             amplitude *= persistence
@@ -181,6 +216,8 @@ class NoiseWorley(Node):
 
     def init(self):
         self._rng = np.random.default_rng(int(self.seed) if self.seed else None)
+        # (shape, x_row, y_col) of the last coordinate grid
+        self._coords = None
 
     def process(self):
         if self.input_data is None:
@@ -199,15 +236,27 @@ class NoiseWorley(Node):
         px = self._rng.uniform(0, 1, num_points)
         py = self._rng.uniform(0, 1, num_points)
         
-        # Create coordinate grid
-        y_coords, x_coords = np.mgrid[0:size_y, 0:size_x] / max(size_x, size_y)
-        
-        # Calculate distance to nearest point
-        noise = np.ones(shape, dtype=np.float32) * 2
+        # Coordinate grid as a (1, 1, W) row and a (1, H, 1) column, rebuilt
+        # only when the input shape changes
+        if self._coords is None or self._coords[0] != shape:
+            extent = max(size_x, size_y)
+            self._coords = (
+                shape,
+                (np.arange(size_x) / extent)[None, None, :],
+                (np.arange(size_y) / extent)[None, :, None],
+            )
+        _, x_row, y_col = self._coords
         
-        for i in range(num_points):
-            dist = np.sqrt((x_coords - px[i])**2 + (y_coords - py[i])**2)
-            noise = np.minimum(noise, dist)
+        # Squared distance to nearest point, for a batch of points at a time
+        # so the (points, H, W) block stays bounded; sqrt is monotonic, so
+        # it is taken once on the minimum
+        dist2 = np.full(shape, 4.0)
+        batch = max(1, _WORLEY_BATCH_ELEMENTS // (size_y * size_x))
+        for start in range(0, num_points, batch):
+            dx = x_row - px[start:start + batch, None, None]
+            dy = y_col - py[start:start + batch, None, None]
+            np.minimum(dist2, (dx * dx + dy * dy).min(axis=0), out=dist2)
+        noise = np.sqrt(dist2)
         
         # Normalize
         if noise.max() > 0:
@@ -250,37 +299,38 @@ class NoiseBlue(Node):
         # Create empty noise grid
         noise = np.zeros(shape, dtype=np.float32)
         
-        # Generate points using dart-throwing with minimum distance
+        # Generate points using dart-throwing with minimum distance. Accepted
+        # points are bucketed into min_radius-sized cells, so a candidate is
+        # only checked against the points in its 3x3 neighbourhood
         points = []
+        cells = {}
         attempts = size_y * size_x // 2
         
-        for _ in range(attempts):
-            x = self._rng.uniform(0, 1)
-            y = self._rng.uniform(0, 1)
+        for x, y in self._rng.uniform(0, 1, (attempts, 2)).tolist():
+            cx, cy = int(x / min_radius), int(y / min_radius)
             
-            # Check minimum distance to existing points
-            valid = True
-            for px, py in points:
-                dist = np.sqrt((x - px)**2 + (y - py)**2)
-                if dist < min_radius:
-                    valid = False
-                    break
+            # Check minimum distance to nearby points
+            nearby = (
+                point
+                for ny in range(cy - 1, cy + 2)
+                for nx in range(cx - 1, cx + 2)
+                for point in cells.get((nx, ny), ())
+            )
+            if any(math.sqrt((x - px)**2 + (y - py)**2) < min_radius for px, py in nearby):
+                continue
             
-            if valid:
-                points.append((x, y))
+            points.append((x, y))
+            cells.setdefault((cx, cy), []).append((x, y))
         
-        # Render points with anti-aliasing
-        for px, py in points:
-            ix = int(px * size_x)
-            iy = int(py * size_y)
-            
-            # Draw a small dot
-            for dy in range(-1, 2):
-                for dx in range(-1, 2):
-                    nx, ny = ix + dx, iy + dy
-                    if 0 <= nx < size_x and 0 <= ny < size_y:
-                        dist = np.sqrt(dx*dx + dy*dy)
-                        noise[ny, nx] = max(noise[ny, nx], 1.0 - dist * 0.5)
+        # Render points with anti-aliasing: every point's dot at once, as
+        # (points, 9) pixel taps with those outside the grid masked off
+        if points:
+            pts = np.asarray(points)
+            ys = (pts[:, 1] * size_y).astype(np.intp)[:, None] + _BLUE_NOISE_DY
+            xs = (pts[:, 0] * size_x).astype(np.intp)[:, None] + _BLUE_NOISE_DX
+            inside = (ys >= 0) & (ys < size_y) & (xs >= 0) & (xs < size_x)
+            dots = np.broadcast_to(_BLUE_NOISE_DOT, ys.shape)
+            np.maximum.at(noise, (ys[inside], xs[inside]), dots[inside])
         
         # Apply intensity and add to input
         self.output = (self.input_data + noise * intensity).astype(np.float32)
@@ -312,18 +362,15 @@ class NoiseSaltPepper(Node):
         salt_ratio = float(self.salt_ratio)
         
         # Copy input
-        result = self.input_data.copy()
-        
-        # Generate random mask for noise positions
-        mask = self._rng.uniform(0, 1, shape) < density
-        
-        # Determine salt vs pepper
-        salt_mask = self._rng.uniform(0, 1, shape) < salt_ratio
+        result = self.input_data.astype(np.float32)
         
-        # Apply salt (white)
-        result[mask & salt_mask] = 1.0
+        # One draw decides both position and kind: [0, salt_cut) is salt,
+        # [salt_cut, density) pepper, which keeps both probabilities as before
+        u = self._rng.random(shape, dtype=np.float32)
+        salt_cut = density * salt_ratio
         
-        # Apply pepper (black)
-        result[mask & ~salt_mask] = 0.0
+        # Apply pepper (black) first, then salt (white) over its sub-range
+        result[u < density] = 0.0
+        result[u < salt_cut] = 1.0
         
-        self.output = result.astype(np.float32)
+        self.output = result
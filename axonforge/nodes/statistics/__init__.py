@@ -11,6 +11,8 @@ from axonforge.core.descriptors import branch
 class Mean(Node):
     """Compute mean of input array."""
 
+    pure = True
+
     input_data = InputPort("Input", np.ndarray)
     mean = OutputPort("Mean", float)
     
@@ -30,6 +32,8 @@ class Mean(Node):
 class Std(Node):
     """Compute standard deviation of input array."""
 
+    pure = True
+
     input_data = InputPort("Input", np.ndarray)
     std = OutputPort("Std Dev", float)
     
@@ -49,6 +53,8 @@ class Std(Node):
 class Variance(Node):
     """Compute variance of input array."""
 
+    pure = True
+
     input_data = InputPort("Input", np.ndarray)
     variance = OutputPort("Variance", float)
     
@@ -68,6 +74,8 @@ class Variance(Node):
 class Sum(Node):
     """Compute sum of input array."""
 
+    pure = True
+
     input_data = InputPort("Input", np.ndarray)
     sum_out = OutputPort("Sum", float)
     
@@ -87,6 +95,8 @@ class Sum(Node):
 class Min(Node):
     """Compute minimum value of input array."""
 
+    pure = True
+
     input_data = InputPort("Input", np.ndarray)
     min_val = OutputPort("Min", float)
     
@@ -106,6 +116,8 @@ class Min(Node):
 class Max(Node):
     """Compute maximum value of input array."""
 
+    pure = True
+
     input_data = InputPort("Input", np.ndarray)
     max_val = OutputPort("Max", float)
     
@@ -125,6 +137,8 @@ class Max(Node):
 class ArgMax(Node):
     """Find index of maximum value."""
 
+    pure = True
+
     input_data = InputPort("Input", np.ndarray)
     argmax = OutputPort("ArgMax", int)
     
@@ -144,6 +158,8 @@ class ArgMax(Node):
 class ArgMin(Node):
     """Find index of minimum value."""
 
+    pure = True
+
     input_data = InputPort("Input", np.ndarray)
     argmin = OutputPort("ArgMin", int)
     
@@ -163,6 +179,8 @@ class ArgMin(Node):
 class Percentile(Node):
     """Compute percentile of input array."""
 
+    pure = True
+
     input_data = InputPort("Input", np.ndarray)
     percentile = OutputPort("Percentile", float)
     
@@ -183,6 +201,8 @@ class Percentile(Node):
 class Histogram(Node):
     """Compute histogram of input array."""
 
+    pure = True
+
     input_data = InputPort("Input", np.ndarray)
     output = OutputPort("Histogram", np.ndarray)
     
@@ -201,6 +221,8 @@ class Histogram(Node):
 class Covariance(Node):
     """Compute covariance matrix of two inputs."""
 
+    pure = True
+
     input_a = InputPort("A", np.ndarray)
     input_b = InputPort("B", np.ndarray)
     covariance = OutputPort("Covariance", float)
@@ -225,6 +247,8 @@ class Covariance(Node):
 class Correlation(Node):
     """Compute Pearson correlation coefficient."""
 
+    pure = True
+
     input_a = InputPort("A", np.ndarray)
     input_b = InputPort("B", np.ndarray)
     correlation = OutputPort("Correlation", float)
@@ -11,6 +11,11 @@ _DATASET_LOAD_LOCK = threading.Lock()
 _DATASET_CACHE = {}
 _APP_NAME = "AxonForge"
 
+# MNIST pixels are cached as raw uint8 (4x smaller than float32); samples are
+# scaled to [0, 1] as they are read. Dividing by a float32 255 matches the
+# old precomputed float32 cache exactly.
+_MNIST_PIXEL_MAX = np.float32(255.0)
+
 
 def _resolve_dataset_cache_dir() -> Path:
     """Resolve persistent dataset cache directory using Qt cache location."""
@@ -26,7 +31,7 @@ def _resolve_dataset_cache_dir() -> Path:
 
 def _mnist_cache_paths(dataset_name: str):
     cache_dir = _resolve_dataset_cache_dir()
-    images_path = cache_dir / f"{dataset_name}_train_images.npy"
+    images_path = cache_dir / f"{dataset_name}_train_images_u8.npy"
     labels_path = cache_dir / f"{dataset_name}_train_labels.npy"
     return images_path, labels_path
 
@@ -38,7 +43,7 @@ def _build_mnist_cache(dataset_name: str, data_path: Path, images_path: Path, la
 
         mn = MNIST(str(data_path))
         images, labels = mn.load_training()
-        images_np = np.array(images, dtype=np.float32).reshape(-1, 28, 28) / 255.0
+        images_np = np.array(images, dtype=np.uint8).reshape(-1, 28, 28)
         labels_np = np.array(labels, dtype=np.int64)
         np.save(images_path, images_np)
         np.save(labels_path, labels_np)
@@ -56,7 +61,8 @@ def _load_dataset_with_python_mnist(dataset_name: str = "mnist"):
         dataset_name: Either "mnist" or "fashion_mnist"
     
     Returns:
-        Tuple of (images, labels) as numpy arrays
+        Tuple of (images, labels) as numpy arrays; images are raw uint8
+        pixels, divide by _MNIST_PIXEL_MAX for [0, 1] floats
     """
     # Determine data directory - go up 4 levels from axonforge/nodes/utilities/__init__.py
     # to reach project root, then go to data/
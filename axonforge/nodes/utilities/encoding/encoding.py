@@ -28,10 +28,13 @@ class OneHotEncode(Node):
 
     def process(self):
 
-        self.o_encoding = np.zeros((self.input_length))
-        self.o_encoding[self.i_index] = 1
+        # Set the hot bit on a local before publishing, rather than writing
+        # back through the port descriptor after assigning the output
+        encoding = np.zeros(self.input_length)
+        encoding[self.i_index] = 1
 
-        self.vector1d = self.o_encoding
+        self.o_encoding = encoding
+        self.vector1d = encoding
         self.value = self.i_index
 
 
@@ -391,12 +394,16 @@ class AccuracyTracker(Node):
         """Initialize history stores."""
         self._prediction_history = []
         self._accuracy_history = []
+        # (prediction history list, correct count within it); recounted
+        # whenever the stored list is replaced, e.g. on load
+        self._window_correct = None
         return super().init()
 
     def _on_reset(self, params: dict):
         """Reset all history stores."""
         self._prediction_history = []
         self._accuracy_history = []
+        self._window_correct = None
         self.linechart = np.array([], dtype=np.float32)
         self.info = "Reset - No data"
         return {"status": "ok", "message": "History reset"}
@@ -415,31 +422,47 @@ class AccuracyTracker(Node):
         # Check if prediction is correct
         is_correct = 1 if predicted == real else 0
 
-        # Add to prediction history
-        pred_history = list(self._prediction_history) if self._prediction_history is not None else []
+        # Add to prediction history; the stored lists are serialized by
+        # copy, so they are appended to and trimmed in place
+        pred_history = self._prediction_history
+        if not isinstance(pred_history, list):
+            pred_history = list(pred_history) if pred_history is not None else []
+            self._prediction_history = pred_history
+
+        # Running count of correct predictions in the window, so each step
+        # only touches the entries that enter and leave it
+        cached = self._window_correct
+        if cached is not None and cached[0] is pred_history:
+            correct = cached[1]
+        else:
+            correct = sum(pred_history)
         pred_history.append(is_correct)
+        correct += is_correct
 
         # Keep only the last 'window' predictions
-        if len(pred_history) > window:
-            pred_history = pred_history[-window:]
+        excess = len(pred_history) - window
+        if window > 0 and excess > 0:
+            correct -= sum(pred_history[:excess])
+            del pred_history[:excess]
 
-        self._prediction_history = pred_history
+        self._window_correct = (pred_history, correct)
 
         # Calculate current accuracy over the window
         if len(pred_history) > 0:
-            current_accuracy = sum(pred_history) / len(pred_history)
+            current_accuracy = correct / len(pred_history)
         else:
             current_accuracy = 0.0
 
         # Add to accuracy history
-        acc_history = list(self._accuracy_history) if self._accuracy_history is not None else []
+        acc_history = self._accuracy_history
+        if not isinstance(acc_history, list):
+            acc_history = list(acc_history) if acc_history is not None else []
+            self._accuracy_history = acc_history
         acc_history.append(current_accuracy)
 
         # Keep only the last 'history' accuracy points for display
         if len(acc_history) > history:
-            acc_history = acc_history[-history:]
-
-        self._accuracy_history = acc_history
+            del acc_history[:-history]
 
         # Update line chart with accuracy history
         self.linechart = np.array(acc_history, dtype=np.float32)
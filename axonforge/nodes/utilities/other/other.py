@@ -21,13 +21,13 @@ class Uniformity(Node):
         if self.input_data is None:
             return
 
-        # Flatten and L2 normalize
-        v = self.input_data.flatten().astype(np.float64)
-        norm = np.linalg.norm(v)
+        # Flatten; the L2-normalized vector squared is just v² / Σv², so
+        # skip the sqrt and the separate normalize pass
+        v = self.input_data.ravel().astype(np.float32, copy=False)
+        v2 = v * v
+        total = v2.sum()
 
-        if norm > 0:
-            v = v / norm
-        else:
+        if total <= 0:
             self.non_uniformity = 0.0
             self.entropy = 0.0
             self.display = 0.0
@@ -35,7 +35,7 @@ class Uniformity(Node):
             return
 
         # Compute probability distribution (sums to 1 by construction)
-        p = v**2
+        p = v2 / total
 
         # Compute entropy
         entropy_val = -np.sum(p * np.log(p + 1e-9))
@@ -8,14 +8,17 @@ The UI calls these directly; no serialization, no network overhead.
 import json
 import importlib
 import multiprocessing
+import os
 import sys
 import threading
 import traceback
 import uuid
 from concurrent.futures import Future, ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Type
 
+import numpy as np
 from PySide6.QtCore import QStandardPaths
 
 from axonforge.core.node import Node
@@ -26,8 +29,11 @@ from axonforge.core.registry import (
     get_all_nodes,
     get_connections,
     get_connections_for_node,
+    get_connections_to,
     add_connection,
     remove_connection,
+    remove_connections_for_node,
+    replace_node,
     clear_node_registry,
 )
 from axonforge.core.descriptors.ports import _format_data_type
@@ -35,8 +41,9 @@ from axonforge.core.descriptors.node import (
     discover_nodes,
     rediscover_nodes,
     build_node_palette,
+    get_discovered_module_mtime,
 )
-from axonforge.network.network import Network, NetworkError
+from axonforge.network.network import Network, NetworkError, signal_key
 
 
 APP_NAME = "AxonForge"
@@ -81,14 +88,33 @@ def _run_node_init_process(module_name: str, class_name: str, node_data: Dict[st
         }
 
 
+@lru_cache(maxsize=1024)
+def _types_compatible(out_types: tuple, in_types: tuple) -> bool:
+    """Memoized core of BridgeAPI._is_type_compatible on normalized tuples."""
+    # None (any type) - always compatible
+    if not out_types or not in_types:
+        return True
+
+    # Check if ANY output type is compatible with ANY input type
+    for out_t in out_types:
+        for in_t in in_types:
+            if BridgeAPI._check_single_type(out_t, in_t):
+                return True
+
+    return False
+
+
 class BridgeAPI:
     """Synchronous API that the Qt UI calls directly."""
 
     def __init__(self) -> None:
+        # Rebound to a new list on every change, never mutated in place, so
+        # the computation thread's snapshot_displays always iterates a
+        # consistent list while the UI thread adds or removes nodes
         self.nodes: List[Node] = []
         self.network: Network = Network()
         self.node_classes: Dict[str, Type[Node]] = {}
-        self.node_palette: Dict[str, List[Type[Node]]] = {}
+        self.node_palette: Mapping[str, Sequence[Type[Node]]] = {}
         self.viewport: Dict[str, Any] = {"pan": {"x": 0.0, "y": 0.0}, "zoom": 1.0}
         self.editor_state: Dict[str, Any] = dict(DEFAULT_EDITOR_STATE)
         self.current_workspace: Optional[str] = None
@@ -111,6 +137,8 @@ class BridgeAPI:
             max_workers=max(1, min(4, multiprocessing.cpu_count() or 1)),
             mp_context=multiprocessing.get_context("spawn"),
         )
+        # Source mtime (st_mtime_ns) each hot-reloaded module was last loaded from
+        self._reloaded_module_mtimes: Dict[str, int] = {}
 
     # ── Initialisation ───────────────────────────────────────────────────
 
@@ -172,29 +200,25 @@ class BridgeAPI:
         buf: Dict[str, Dict[str, Any]] = {}
         for node in self.nodes:
             outputs: Dict[str, Any] = {}
-            for name, descriptor in getattr(node.__class__, "_outputs", {}).items():
-                try:
-                    val = getattr(node, name)
-                except Exception:
-                    val = None
-                # Include display configuration from descriptor
-                output_config = {}
-                if hasattr(descriptor, 'color_mode'):
-                    output_config['color_mode'] = descriptor.color_mode
-                # Include scale configuration for bar/line charts
-                if hasattr(descriptor, 'scale_mode'):
-                    output_config['scale_mode'] = descriptor.scale_mode
-                    output_config['scale_min'] = descriptor.scale_min
-                    output_config['scale_max'] = descriptor.scale_max
+            # Display.__get__ is a plain instance-dict read; do it inline
+            # rather than through getattr and the descriptor call per output
+            values = node.__dict__
+            for name, descriptor in node.__class__._outputs.items():
+                # Display configuration (color mode, bar/line chart scale),
+                # cached on the descriptor until it changes
                 outputs[name] = {
-                    'value': val,
-                    'config': output_config
+                    'value': values.get(descriptor._attr, descriptor.default),
+                    'config': descriptor.display_config()
                 }
             buf[node.node_id] = outputs
         with self._buffer_lock:
             self._display_buffer = buf
             self._dirty = True
 
+    def display_buffer_pending(self) -> bool:
+        """Whether the last snapshot is still waiting to be read by the UI."""
+        return self._dirty
+
     def read_display_buffer(self) -> Optional[Dict[str, Dict[str, Any]]]:
         """Read the display buffer if dirty. Returns None if clean."""
         with self._buffer_lock:
@@ -275,6 +299,8 @@ class BridgeAPI:
                         error = f"Failed to apply init state: {exc}"
                         worker_traceback = traceback.format_exc()
                     else:
+                        if self.network:
+                            self.network.mark_dirty(node_id)
                         if self.network and not self.network.running:
                             try:
                                 self.network.propagate_from_node(node_id, recompute_start=True)
@@ -311,7 +337,7 @@ class BridgeAPI:
         node = node_class(x=x, y=y)
         register_node(node)
         node.validate_required_methods()
-        self.nodes.append(node)
+        self.nodes = [*self.nodes, node]
 
         if getattr(node.__class__, "_uses_background_init", False):
             self._start_background_init(node)
@@ -349,11 +375,7 @@ class BridgeAPI:
         if not get_node(node_id):
             raise ValueError(f"Node not found: {node_id}")
         self._cancel_background_init(node_id)
-        for conn in get_connections_for_node(node_id):
-            remove_connection(
-                conn["from_node"], conn["from_output"],
-                conn["to_node"], conn["to_input"],
-            )
+        remove_connections_for_node(node_id)
         self.nodes = [n for n in self.nodes if n.node_id != node_id]
         unregister_node(node_id)
         with self._loading_lock:
@@ -378,6 +400,8 @@ class BridgeAPI:
         if not node:
             raise ValueError(f"Node not found: {node_id}")
         setattr(node, prop_key, value)
+        if self.network:
+            self.network.mark_dirty(node_id)
         # Only propagate when network is not running (let running network handle processing)
         if self.network and not self.network.running:
             try:
@@ -424,14 +448,9 @@ class BridgeAPI:
         if not fn or not tn:
             raise ValueError("Node not found")
 
-        from_port = next(
-            (p for p in getattr(fn.__class__, "_output_ports", {}).values()
-             if p.name == from_output), None,
-        )
-        to_port = next(
-            (p for p in getattr(tn.__class__, "_input_ports", {}).values()
-             if p.name == to_input), None,
-        )
+        # Port registries are keyed by attribute name, which is the port name
+        from_port = fn.__class__._output_ports.get(from_output)
+        to_port = tn.__class__._input_ports.get(to_input)
         if not from_port or not to_port:
             raise ValueError("Port not found")
 
@@ -442,15 +461,14 @@ class BridgeAPI:
             )
 
         # Remove existing connection to the same input
-        for conn in get_connections():
-            if conn["to_node"] == to_node and conn["to_input"] == to_input:
-                remove_connection(
-                    conn["from_node"], conn["from_output"],
-                    conn["to_node"], conn["to_input"],
-                )
-                if self.network and hasattr(self.network, "_signals_now"):
-                    key = (conn["from_node"], conn["from_output"])
-                    self.network._signals_now.pop(key, None)
+        for conn in get_connections_to(to_node, to_input):
+            remove_connection(
+                conn["from_node"], conn["from_output"],
+                conn["to_node"], conn["to_input"],
+            )
+            if self.network and hasattr(self.network, "_signals_now"):
+                key = signal_key(conn["from_node"], conn["from_output"])
+                self.network._signals_now.pop(key, None)
 
         if not add_connection(from_node, from_output, to_node, to_input):
             raise ValueError("Connection already exists")
@@ -474,7 +492,7 @@ class BridgeAPI:
         if target and hasattr(target, to_input):
             setattr(target, to_input, None)
         if self.network:
-            key = (from_node, from_output)
+            key = signal_key(from_node, from_output)
             if hasattr(self.network, "_signals_now"):
                 self.network._signals_now.pop(key, None)
         self.snapshot_displays()
@@ -534,17 +552,25 @@ class BridgeAPI:
         self._save_app_config()
 
     def list_recent_projects(self) -> List[str]:
-        kept: List[str] = []
+        return [path for path, _ in self._stat_recent_projects()]
+
+    def _stat_recent_projects(self) -> List[Tuple[str, os.stat_result]]:
+        """Recent projects whose project file still exists, with that file's stat."""
+        found: List[Tuple[str, os.stat_result]] = []
         for path in self._recent_projects:
             p = Path(path)
-            if (p / PROJECT_FILENAME).exists():
-                kept.append(str(p))
+            try:
+                stat = (p / PROJECT_FILENAME).stat()
+            except OSError:
+                continue
+            found.append((str(p), stat))
+        kept = [path for path, _ in found]
         if kept != self._recent_projects:
             self._recent_projects = kept
             self._save_app_config()
         else:
             self._recent_projects = kept
-        return list(self._recent_projects)
+        return found
 
     def _clear_graph_state(self) -> None:
         with self._init_jobs_lock:
@@ -553,7 +579,7 @@ class BridgeAPI:
                     future.cancel()
             self._pending_init_jobs.clear()
         clear_node_registry()
-        self.nodes.clear()
+        self.nodes = []
         self.viewport = {"pan": {"x": 0.0, "y": 0.0}, "zoom": 1.0}
         self.editor_state = dict(DEFAULT_EDITOR_STATE)
         self._apply_editor_state_to_network()
@@ -588,7 +614,6 @@ class BridgeAPI:
             array_name = f"{uuid.uuid4().hex}.npy"
             array_rel_path = Path(PROJECT_DATA_DIRNAME) / array_name
             array_abs_path = target_dir / array_rel_path
-            import numpy as np
             np.save(array_abs_path, array)
             return {
                 "_type": "ndarray_ref",
@@ -605,8 +630,11 @@ class BridgeAPI:
             "connections": get_connections(),
         }
         project_file = target_dir / PROJECT_FILENAME
+        # Encode once and write in a single call; json.dump would issue a
+        # write per encoded chunk. Compact, since only indent=None takes the
+        # C encoder (arrays live in side files, so this is all metadata)
         with open(project_file, "w", encoding="utf-8") as f:
-            json.dump(payload, f, indent=2)
+            f.write(json.dumps(payload))
 
         self.current_project_dir = target_dir
         self.current_workspace = target_dir.name
@@ -621,8 +649,6 @@ class BridgeAPI:
         with open(project_file, encoding="utf-8") as f:
             data = json.load(f)
 
-        self._clear_graph_state()
-
         def _array_loader(ref: dict) -> Any:
             ref_file = str(ref.get("file", "")).strip()
             if not ref_file:
@@ -634,39 +660,51 @@ class BridgeAPI:
                 raise ValueError(f"Invalid ndarray_ref path outside project: {ref_file}")
             if not array_path.exists():
                 raise FileNotFoundError(f"Array file not found: {array_path}")
-            import numpy as np
             return np.load(array_path, allow_pickle=False)
 
-        node_id_map: Dict[str, str] = {}
+        # Build and initialize every node before touching the live graph, so
+        # the computation thread never steps a half-built project and a load
+        # that fails here leaves the open project intact.
+        # Entries are (saved id, node, init error); the error is None for
+        # background-init nodes, which start once they are registered
+        loaded: List[Tuple[Any, Node, Optional[str]]] = []
         for nd in data.get("nodes", []):
             cls = self.node_classes.get(nd.get("type"))
             if not cls:
                 continue
             node = cls.from_dict(nd, array_loader=_array_loader)
-            new_id = register_node(node)
-            node_id_map[nd.get("id")] = new_id
-            self.nodes.append(node)
-            if getattr(node.__class__, "_uses_background_init", False):
-                self._start_background_init(node)
-            else:
+            init_error: Optional[str] = None
+            if not getattr(node.__class__, "_uses_background_init", False):
                 try:
                     node.init()
                 except Exception as e:
-                    error = str(e)
+                    init_error = str(e)
                     tb = traceback.format_exc()
-                    node._loading_error = error
-                    self._set_node_loading_state(new_id, False, error)
                     print(f"Node init failed for {node.node_type}: {e}")
                     print(tb)
                 else:
-                    node._loading_error = ""
-                    self._set_node_loading_state(new_id, False, "")
+                    init_error = ""
+                node._loading_error = init_error
+            loaded.append((nd.get("id"), node, init_error))
+
+        # Swap the graph in: registry and connection updates only
+        self._clear_graph_state()
+        node_id_map: Dict[str, str] = {}
+        for saved_id, node, _ in loaded:
+            node_id_map[saved_id] = register_node(node)
 
         for conn in data.get("connections", []):
             fn = node_id_map.get(conn["from_node"])
             tn = node_id_map.get(conn["to_node"])
             if fn and tn:
                 add_connection(fn, conn["from_output"], tn, conn["to_input"])
+        self.nodes = [node for _, node, _ in loaded]
+
+        for _, node, init_error in loaded:
+            if init_error is None:
+                self._start_background_init(node)
+            else:
+                self._set_node_loading_state(node.node_id, False, init_error)
 
         self.viewport = data.get("viewport", {"pan": {"x": 0, "y": 0}, "zoom": 1.0})
         self.set_editor_state(data.get("editor", {}))
@@ -679,9 +717,7 @@ class BridgeAPI:
     # Legacy compatibility wrappers (workspace -> project)
     def list_workspaces(self) -> List[dict]:
         result = []
-        for project_path in self.list_recent_projects():
-            path = Path(project_path) / PROJECT_FILENAME
-            stat = path.stat()
+        for project_path, stat in self._stat_recent_projects():
             result.append({
                 "name": Path(project_path).name,
                 "created": stat.st_ctime,
@@ -713,8 +749,6 @@ class BridgeAPI:
     # ── Hot Reload ───────────────────────────────────────────────────────
 
     def reload_node(self, node_id: str) -> Node:
-        from axonforge.core.registry import _node_registry
-
         old = get_node(node_id)
         if not old:
             raise ValueError(f"Node not found: {node_id}")
@@ -727,7 +761,20 @@ class BridgeAPI:
         if not module:
             raise RuntimeError(f"Module not found: {module_path}")
 
-        importlib.reload(module)
+        # Re-executing a module is a full compile + exec; skip it when the
+        # source hasn't changed since it was last loaded (the node itself is
+        # still rebuilt below)
+        try:
+            mtime = Path(module.__file__).stat().st_mtime_ns
+        except (AttributeError, TypeError, OSError):
+            mtime = None
+        loaded_mtime = self._reloaded_module_mtimes.get(module_path)
+        if loaded_mtime is None:
+            loaded_mtime = get_discovered_module_mtime(module_path)
+        if mtime is None or mtime != loaded_mtime:
+            importlib.reload(module)
+            if mtime is not None:
+                self._reloaded_module_mtimes[module_path] = mtime
         new_class = getattr(module, old.__class__.__name__)
         if not getattr(new_class, "dynamic", False):
             raise ValueError("Reloaded class is no longer dynamic")
@@ -753,7 +800,7 @@ class BridgeAPI:
         new_node._loading_error = ""
 
         # Only copy property values, not store values
-        for prop_name in getattr(old.__class__, "_properties", {}).keys():
+        for prop_name in old.__class__._properties.keys():
             if hasattr(old, prop_name):
                 try:
                     setattr(new_node, prop_name, getattr(old, prop_name))
@@ -763,12 +810,9 @@ class BridgeAPI:
         if hasattr(old, "_output_enabled"):
             new_node._output_enabled = old._output_enabled.copy()
 
-        for i, n in enumerate(self.nodes):
-            if n.node_id == node_id:
-                self.nodes[i] = new_node
-                break
+        self.nodes = [new_node if n.node_id == node_id else n for n in self.nodes]
 
-        _node_registry[node_id] = new_node
+        replace_node(node_id, new_node)
         if new_class.__name__ in self.node_classes:
             self.node_classes[new_class.__name__] = new_class
 
@@ -859,28 +903,22 @@ class BridgeAPI:
             - List means "any of these types" (OR logic)
             - Single type uses subclass checking
         """
-        def normalize(t: Optional[Any]) -> List[Any]:
-            """Normalize to list for uniform handling. Empty list = any type."""
+        def normalize(t: Optional[Any]) -> tuple:
+            """Normalize to a tuple for uniform handling. Empty = any type."""
             if t is None:
-                return []
+                return ()
             if isinstance(t, (list, tuple, set)):
-                return list(t)
-            return [t]
+                return tuple(t)
+            return (t,)
 
         out_types = normalize(output_type)
         in_types = normalize(input_type)
-
-        # None (any type) - always compatible
-        if not out_types or not in_types:
-            return True
-
-        # Check if ANY output type is compatible with ANY input type
-        for out_t in out_types:
-            for in_t in in_types:
-                if BridgeAPI._check_single_type(out_t, in_t):
-                    return True
-
-        return False
+        try:
+            # Port types repeat across connections (mostly ndarray → ndarray)
+            return _types_compatible(out_types, in_types)
+        except TypeError:
+            # Unhashable type spec; check it directly
+            return _types_compatible.__wrapped__(out_types, in_types)
 
     @staticmethod
     def _check_single_type(output_type: Any, input_type: Any) -> bool:
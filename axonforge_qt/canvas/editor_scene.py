@@ -10,6 +10,8 @@ from PySide6.QtCore import Qt, QPointF, QRectF, Signal, QLineF
 from PySide6.QtGui import QPen, QColor
 from PySide6.QtWidgets import QGraphicsScene, QGraphicsSceneMouseEvent, QGraphicsProxyWidget, QApplication
 
+from axonforge.core.registry import get_connections
+
 from .node_item import NodeItem
 from .port_item import PortItem, PortHitZoneItem
 from .connection_item import ConnectionItem, ConnectionPreviewItem
@@ -401,7 +403,6 @@ class EditorScene(QGraphicsScene):
             self.removeItem(item)
         self._connection_items.clear()
 
-        from axonforge.core.registry import get_connections
         for conn in get_connections():
             self.add_connection_item(conn)
 
@@ -4,6 +4,7 @@ NodeQuickAddPopup — Shift+A quick node picker with search + cascading categori
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple, Type
 
@@ -29,6 +30,9 @@ ROLE_PATH = Qt.ItemDataRole.UserRole + 4
 KIND_CATEGORY = "category"
 KIND_NODE = "node"
 
+# Everything str.isalnum() rejects (\w is alphanumerics plus "_")
+_NON_ALNUM = re.compile(r"[\W_]+")
+
 
 @dataclass
 class _BranchNode:
@@ -194,6 +198,11 @@ class NodeQuickAddPopup(QWidget):
 
         self._root_branch = self._build_branch_tree(node_palette)
         self._flat_nodes = self._build_flat_nodes(node_palette)
+        # Search keys per node, normalized once rather than on every keystroke
+        self._search_keys = [
+            (self._normalize_text(full_path), self._normalize_text(node_type))
+            for full_path, node_type in self._flat_nodes
+        ]
         self._root_cascade: Optional[_CascadeCategoryPopup] = None
         self._event_filter_installed = False
         self._selection_emitted = False
@@ -317,7 +326,7 @@ class NodeQuickAddPopup(QWidget):
 
     @staticmethod
     def _normalize_text(text: str) -> str:
-        return "".join(ch for ch in text.lower() if ch.isalnum())
+        return _NON_ALNUM.sub("", text.lower())
 
     @staticmethod
     def _subsequence_score(needle: str, haystack: str) -> int:
@@ -333,12 +342,10 @@ class NodeQuickAddPopup(QWidget):
             pos = idx + 1
         return max(1, 400 - gap_penalty)
 
-    def _score_match(self, query: str, full_path: str, node_type: str) -> int:
-        qn = self._normalize_text(query)
+    def _score_match(self, qn: str, pn: str, nn: str) -> int:
+        """Score a normalized query against a node's normalized path and type."""
         if not qn:
             return 0
-        nn = self._normalize_text(node_type)
-        pn = self._normalize_text(full_path)
 
         if nn.startswith(qn):
             return 1000 - len(nn)
@@ -361,8 +368,9 @@ class NodeQuickAddPopup(QWidget):
 
     def _search_nodes(self, query: str) -> List[Tuple[str, str, int]]:
         matches: List[Tuple[str, str, int]] = []
-        for full_path, node_type in self._flat_nodes:
-            score = self._score_match(query, full_path, node_type)
+        qn = self._normalize_text(query)
+        for (full_path, node_type), (pn, nn) in zip(self._flat_nodes, self._search_keys):
+            score = self._score_match(qn, pn, nn)
             if score >= 0:
                 matches.append((full_path, node_type, score))
         matches.sort(key=lambda x: (-x[2], len(x[1]), x[0].lower()))
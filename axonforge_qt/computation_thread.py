@@ -28,27 +28,46 @@ class ComputationThread(QThread):
 
     def run(self) -> None:
         network = self.bridge.network
+        # Bound once: the network is fixed for the thread's lifetime and
+        # defines running/speed/max_speed itself, so the step loop needs
+        # no per-iteration getattr fallbacks
+        execute_step = network.execute_step
+        snapshot_displays = self.bridge.snapshot_displays
+        display_buffer_pending = self.bridge.display_buffer_pending
+        last_step_time = None
+        # A step ran whose displays have not been snapshotted yet
+        unsnapshotted = False
+        # Throttle period in ms, recomputed only when the speed changes
+        speed = None
+        period_ms = 0
         while not self._stop_flag:
             if network.running:
                 try:
-                    network.execute_step()
+                    execute_step()
 
                     # Update actual Hz
                     now = time.monotonic()
-                    last = getattr(self, "_last_step_time", None)
-                    if last is not None:
-                        dt = now - last
+                    if last_step_time is not None:
+                        dt = now - last_step_time
                         if dt > 0:
                             network.actual_hz = 1.0 / dt
-                    self._last_step_time = now
+                    last_step_time = now
 
-                    # Snapshot display outputs into shared buffer
-                    self.bridge.snapshot_displays()
+                    # Snapshot display outputs into shared buffer, unless the
+                    # UI has not read the previous one yet: above the refresh
+                    # rate most snapshots would be replaced unseen
+                    if display_buffer_pending():
+                        unsnapshotted = True
+                    else:
+                        snapshot_displays()
+                        unsnapshotted = False
 
                     # Throttle based on speed setting
-                    speed = float(network.speed)
-                    if not bool(getattr(network, "max_speed", False)):
-                        self.msleep(int(1000.0 / max(speed, 1.0)))
+                    if not network.max_speed:
+                        if network.speed != speed:
+                            period_ms = int(1000.0 / max(float(network.speed), 1.0))
+                            speed = network.speed
+                        self.msleep(period_ms)
 
                 except NetworkError as e:
                     self.network_error.emit(e.node_id, e.node_name, str(e.error), e.traceback)
@@ -56,6 +75,10 @@ class ComputationThread(QThread):
                 except Exception:
                     self.msleep(100)
             else:
+                if unsnapshotted:
+                    # Stopped after skipped snapshots: publish the final state
+                    snapshot_displays()
+                    unsnapshotted = False
                 self.msleep(50)
 
     def request_stop(self) -> None:
@@ -34,6 +34,9 @@ class MainWindow(QMainWindow):
         self._resize_anchor_horizontal: tuple[QPoint, QPointF] | None = None
         self._resize_anchor_vertical: tuple[QPoint, QPointF] | None = None
         self._shortcuts: list[QShortcut] = []
+        # Running state the header was last styled for; restyling (a
+        # stylesheet unpolish/polish) only happens when it changes
+        self._styled_running: bool | None = None
 
         self.setWindowTitle("AxonForge — Node Editor")
         self.setMinimumSize(1200, 700)
@@ -254,10 +257,17 @@ class MainWindow(QMainWindow):
         running = state["running"]
         max_speed = bool(state.get("max_speed", False))
         speed = int(state.get("speed", 60))
-        self._toggle_btn.setText("Stop" if running else "Start")
-        self._toggle_btn.setProperty("running", "true" if running else "false")
-        self._toggle_btn.style().unpolish(self._toggle_btn)
-        self._toggle_btn.style().polish(self._toggle_btn)
+        if running != self._styled_running:
+            self._styled_running = running
+            self._toggle_btn.setText("Stop" if running else "Start")
+            self._toggle_btn.setProperty("running", "true" if running else "false")
+            self._toggle_btn.style().unpolish(self._toggle_btn)
+            self._toggle_btn.style().polish(self._toggle_btn)
+
+            # Update header bar style based on running state
+            self._header_bar.setProperty("running", "true" if running else "false")
+            self._header_bar.style().unpolish(self._header_bar)
+            self._header_bar.style().polish(self._header_bar)
         self._actual_hz.setText(f"{state['actual_hz']:.1f} Hz")
         if self._speed_input.value() != speed:
             self._speed_input.blockSignals(True)
@@ -269,11 +279,6 @@ class MainWindow(QMainWindow):
             self._max_speed_checkbox.blockSignals(False)
         self._speed_input.setEnabled(not max_speed)
 
-        # Update header bar style based on running state
-        self._header_bar.setProperty("running", "true" if running else "false")
-        self._header_bar.style().unpolish(self._header_bar)
-        self._header_bar.style().polish(self._header_bar)
-
     # ── Network controls ─────────────────────────────────────────────────
 
     def _on_splitter_moved(self, pos: int, index: int) -> None:
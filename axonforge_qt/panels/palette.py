@@ -7,6 +7,7 @@ Branch paths like "Input/Noise" create nested tree structure.
 
 from __future__ import annotations
 
+import colorsys
 import hashlib
 from typing import Dict, List, Type, TYPE_CHECKING, Union
 
@@ -41,7 +42,6 @@ def _generate_neon_color(text: str) -> str:
     brightness = 80 + (hash_int >> 16) % 21
     
     # Convert HSV to RGB
-    import colorsys
     r, g, b = colorsys.hsv_to_rgb(hue / 360, saturation / 100, brightness / 100)
     
     # Convert to hex
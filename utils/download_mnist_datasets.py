@@ -11,9 +11,11 @@ The input nodes in this project are configured to look in these locations.
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from urllib.request import urlopen, Request
 from urllib.error import URLError, HTTPError
+import shutil
 import sys
 
 
@@ -44,16 +46,43 @@ DATASETS = {
     },
 }
 
+# Read/write size for streaming a download to disk
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# Files fetched concurrently
+MAX_PARALLEL_DOWNLOADS = 4
+
 
 def download_file(url: str, dest: Path) -> None:
     dest.parent.mkdir(parents=True, exist_ok=True)
     req = Request(url, headers={"User-Agent": "MiniCortex dataset downloader"})
     with urlopen(req) as resp, dest.open("wb") as f:
-        while True:
-            chunk = resp.read(1024 * 64)
-            if not chunk:
-                break
-            f.write(chunk)
+        shutil.copyfileobj(resp, f, length=COPY_BUFFER_SIZE)
+
+
+def log(line: str) -> None:
+    # One write per line, so lines from concurrent fetches don't interleave
+    sys.stdout.write(f"{line}\n")
+
+
+def fetch(filename: str, base_urls: list[str], dest: Path) -> str | None:
+    """Try each mirror in turn; return the last error, or None on success."""
+    log(f"  fetch {filename}")
+    last_error = None
+    for base_url in base_urls:
+        url = f"{base_url}/{filename}"
+        try:
+            download_file(url, dest)
+            return None
+        except (HTTPError, URLError, OSError) as exc:
+            last_error = exc
+            log(f"  fail  {filename} @ {base_url}: {exc}")
+            if dest.exists():
+                try:
+                    dest.unlink()
+                except OSError:
+                    pass
+    return str(last_error)
 
 
 def main() -> int:
@@ -61,7 +90,7 @@ def main() -> int:
     target_root = repo_root / "data" / "mnist"
     print(f"Target root: {target_root}")
 
-    failures = []
+    jobs = []
     for dataset_name, spec in DATASETS.items():
         dataset_dir = target_root / dataset_name
         print(f"\n[{dataset_name}] -> {dataset_dir}")
@@ -74,24 +103,14 @@ def main() -> int:
                 print(f"  skip  {filename} (exists)")
                 continue
 
-            print(f"  fetch {filename}")
-            last_error = None
-            for base_url in spec["base_urls"]:
-                url = f"{base_url}/{filename}"
-                try:
-                    download_file(url, dest)
-                    last_error = None
-                    break
-                except (HTTPError, URLError, OSError) as exc:
-                    last_error = exc
-                    print(f"  fail  {filename} @ {base_url}: {exc}")
-                    if dest.exists():
-                        try:
-                            dest.unlink()
-                        except OSError:
-                            pass
-            if last_error is not None:
-                failures.append((filename, str(last_error)))
+            jobs.append((filename, spec["base_urls"], dest))
+
+    # Each file is network-bound, so fetch several at once
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_DOWNLOADS) as pool:
+        errors = list(pool.map(lambda job: fetch(*job), jobs))
+    failures = [
+        (filename, err) for (filename, _, _), err in zip(jobs, errors) if err is not None
+    ]
 
     if failures:
         print("\nSome downloads failed:", file=sys.stderr)